@@ -3,12 +3,12 @@ from builtins import object
 import warnings
 from django.conf.urls import url, include
 from django.core.exceptions import ImproperlyConfigured
-from django.urls import reverse
+from django.urls import NoReverseMatch, reverse
 from django.http import HttpResponse, HttpResponseBadRequest
 from tastypie.exceptions import NotRegistered, BadRequest
 from tastypie.serializers import Serializer
 from tastypie.utils import trailing_slash, is_valid_jsonp_callback_value, \
-    IS_DJANGO_1_4
+    urlconf_cache_key, UriTrie, IS_DJANGO_1_4
 if IS_DJANGO_1_4:
     from django.conf.urls import patterns
 from tastypie.utils.mime import determine_format, build_content_type
@@ -30,6 +30,7 @@ class Api(object):
         self.api_name = api_name
         self._registry = {}
         self._canonicals = {}
+        self._uri_tries = {}
         self.serializer = serializer_class()
 
     def register(self, resource, canonical=True):
@@ -46,6 +47,7 @@ class Api(object):
             raise ImproperlyConfigured("Resource %r must define a 'resource_name'." % resource)
 
         self._registry[resource_name] = resource
+        self._uri_tries = {}
 
         if canonical is True:
             if resource_name in self._canonicals:
@@ -67,6 +69,8 @@ class Api(object):
         if resource_name in self._canonicals:
             del(self._canonicals[resource_name])
 
+        self._uri_tries = {}
+
     def canonical_resource_for(self, resource_name):
         """
         Returns the canonical resource for a given ``resource_name``.
@@ -76,6 +80,48 @@ class Api(object):
 
         raise NotRegistered("No resource was registered as canonical for '%s'." % resource_name)
 
+    def get_uri_trie(self):
+        """
+        Returns a ``UriTrie`` mapping the list URI of every registered
+        resource to that resource.
+
+        Built once per URLconf & script prefix, and rebuilt whenever a
+        resource is registered or unregistered.
+        """
+        cache_key = urlconf_cache_key()
+
+        try:
+            return self._uri_tries[cache_key]
+        except KeyError:
+            pass
+
+        trie = UriTrie()
+
+        for name, resource in self._registry.items():
+            try:
+                list_uri = self._build_reverse_url("api_dispatch_list", kwargs={
+                    'api_name': self.api_name,
+                    'resource_name': name,
+                })
+            except NoReverseMatch:
+                continue
+
+            trie.add(list_uri, resource)
+
+        self._uri_tries[cache_key] = trie
+        return trie
+
+    def resource_for_uri(self, uri):
+        """
+        Returns the registered resource whose list URI is the longest prefix
+        of ``uri``, or ``None``.
+
+        This only looks at the path segments of ``uri``, without going
+        through ``resolve``. Use ``Resource.parse_detail_uri`` to check &
+        pull apart the rest of it.
+        """
+        return self.get_uri_trie().lookup(uri)
+
     def wrap_view(self, view):
         def wrapper(request, *args, **kwargs):
             try:
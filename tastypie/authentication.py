@@ -2,13 +2,15 @@ from __future__ import unicode_literals
 from builtins import str
 from builtins import object
 import base64
+import hashlib
 import hmac
 import time
 import uuid
 
 from django.conf import settings
 from django.contrib.auth import authenticate
-from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
 from django.middleware.csrf import _sanitize_token, constant_time_compare
 from tastypie.utils.http import same_origin
 from django.utils.translation import ugettext as _
@@ -36,6 +38,45 @@ except ImportError:
     oauth_provider = None
 
 
+def get_api_key_cache_key(username, api_key):
+    """
+    The cache key ``ApiKeyAuthentication`` keeps a verified (or refused)
+    username & API key under. Hashed, so keys never sit in the cache in the
+    clear.
+    """
+    credentials = ('%s\x00%s' % (username, api_key)).encode('utf-8')
+    return 'tastypie_api_key_%s' % hashlib.sha256(credentials).hexdigest()
+
+
+def get_api_key_user_cache_key(user_pk):
+    return 'tastypie_api_key_user_%s' % user_pk
+
+
+def invalidate_cached_api_key(api_key):
+    """
+    Drops what ``ApiKeyAuthentication`` has cached for an ``ApiKey``'s user.
+
+    Connected to the ``post_save`` & ``post_delete`` signals of ``ApiKey``.
+    """
+    user_key = get_api_key_user_cache_key(api_key.user_id)
+    keys = [user_key]
+    cached_key = cache.get(user_key)
+
+    if cached_key is not None:
+        # Whatever was verified before the key changed.
+        keys.append(cached_key)
+
+    try:
+        from tastypie.compat import get_username_field
+        # A refusal of the new key.
+        keys.append(get_api_key_cache_key(getattr(api_key.user, get_username_field()), api_key.key))
+    except ObjectDoesNotExist:
+        # The user is being deleted along with the key.
+        pass
+
+    cache.delete_many(keys)
+
+
 class Authentication(object):
     """
     A simple base class to establish the protocol for auth.
@@ -45,6 +86,14 @@ class Authentication(object):
     def __init__(self, require_active=True):
         self.require_active = require_active
 
+    def get_request_memo_key(self):
+        """
+        Identifies the backend & its settings, so resources with equivalent
+        backends can share what one of them has worked out about a request
+        (see ``Resource.is_authenticated``).
+        """
+        return (type(self),) + tuple(sorted(vars(self).items()))
+
     def is_authenticated(self, request, **kwargs):
         """
         Identifies if the user is authenticated to continue or not.
@@ -156,7 +205,17 @@ class ApiKeyAuthentication(Authentication):
     Uses the ``ApiKey`` model that ships with tastypie. If you wish to use
     a different model, override the ``get_key`` method to perform the key check
     as suits your needs.
+
+    Optionally accepts a ``cache_timeout``, in seconds, for keeping verified
+    credentials in the cache, and a ``negative_cache_timeout`` for keeping
+    refused ones. Both default to ``None`` (no caching). Saving or deleting
+    an ``ApiKey`` drops its user's entries.
     """
+    def __init__(self, require_active=True, cache_timeout=None, negative_cache_timeout=None):
+        super(ApiKeyAuthentication, self).__init__(require_active=require_active)
+        self.cache_timeout = cache_timeout
+        self.negative_cache_timeout = negative_cache_timeout
+
     def _unauthorized(self):
         return False
 
@@ -193,6 +252,20 @@ class ApiKeyAuthentication(Authentication):
         if not username or not api_key:
             return self._unauthorized()
 
+        if type(self).get_key == ApiKeyAuthentication.get_key:
+            # ``get_key`` isn't overridden, so the user & key can be checked
+            # together, with the cache in front.
+            user = self.get_user_for_key(username, api_key)
+
+            if user is None:
+                return self._unauthorized()
+
+            if not self.check_active(user):
+                return False
+
+            request.user = user
+            return True
+
         try:
             lookup_kwargs = {username_field: username}
             user = User.objects.get(**lookup_kwargs)
@@ -208,6 +281,44 @@ class ApiKeyAuthentication(Authentication):
 
         return key_auth_check
 
+    def get_user_for_key(self, username, api_key):
+        """
+        Returns the user owning the username & API key, or ``None``.
+
+        Checks the cache first (when ``cache_timeout`` or
+        ``negative_cache_timeout`` is set), then the ``ApiKey`` & its user in
+        a single query.
+        """
+        from tastypie.compat import get_username_field
+        from tastypie.models import ApiKey
+
+        caching = self.cache_timeout is not None or self.negative_cache_timeout is not None
+        cache_key = get_api_key_cache_key(username, api_key)
+
+        if caching:
+            cached = cache.get(cache_key)
+
+            if cached is not None:
+                # ``False`` marks a refusal.
+                return cached or None
+
+        lookup_kwargs = {'user__%s' % get_username_field(): username, 'key': api_key}
+
+        try:
+            user = ApiKey.objects.select_related('user').get(**lookup_kwargs).user
+        except (ApiKey.DoesNotExist, ApiKey.MultipleObjectsReturned):
+            user = None
+
+        if user is not None and self.cache_timeout is not None:
+            cache.set_many({
+                cache_key: user,
+                get_api_key_user_cache_key(user.pk): cache_key,
+            }, self.cache_timeout)
+        elif user is None and self.negative_cache_timeout is not None:
+            cache.set(cache_key, False, self.negative_cache_timeout)
+
+        return user
+
     def get_key(self, user, api_key):
         """
         Attempts to find the API key for the user. Uses ``ApiKey`` by default
@@ -492,6 +603,13 @@ class MultiAuthentication(object):
         super(MultiAuthentication, self).__init__(**kwargs)
         self.backends = backends
 
+    def get_request_memo_key(self):
+        """
+        Identifies the backends, in order (see
+        ``Authentication.get_request_memo_key``).
+        """
+        return (type(self),) + tuple(backend.get_request_memo_key() for backend in self.backends)
+
     def is_authenticated(self, request, **kwargs):
         """
         Identifies if the user is authenticated to continue or not.
@@ -7,6 +7,11 @@ class Authorization(object):
     """
     A base class that provides no permissions checking.
     """
+    # Whether ``create_list`` handles a plain list of unsaved objects, as
+    # ``ModelResource`` passes with ``Meta.bulk_create``. Otherwise, each
+    # object goes through ``create_detail``.
+    create_list_accepts_objects = False
+
     def __get__(self, instance, owner):
         """
         Makes ``Authorization`` a descriptor of ``ResourceOptions`` and creates
@@ -24,6 +29,21 @@ class Authorization(object):
         """
         raise TastypieError("Authorization classes no longer support `apply_limits`. Please update to using `read_list`.")
 
+    def get_cache_scope(self, bundle):
+        """
+        Returns a string that sets apart the users who may see different data
+        from the same request, for ``Meta.cache_responses``.
+
+        Scopes by user by default. Return the same value for everyone if reads
+        aren't limited per user.
+        """
+        user = getattr(bundle.request, 'user', None)
+
+        if user is None or not getattr(user, 'is_authenticated', False):
+            return 'anonymous'
+
+        return 'user:%s' % user.pk
+
     def read_list(self, object_list, bundle):
         """
         Returns a list of all the objects a user is allowed to read.
@@ -104,6 +124,8 @@ class ReadOnlyAuthorization(Authorization):
 
     Only allows ``GET`` requests.
     """
+    create_list_accepts_objects = True
+
     def read_list(self, object_list, bundle):
         return object_list
 
@@ -138,6 +160,8 @@ class DjangoAuthorization(Authorization):
     Both the list & detail variants simply check the model they're based
     on, as that's all the more granular Django's permission setup gets.
     """
+    create_list_accepts_objects = True
+
     def base_checks(self, request, model_klass):
         # If it doesn't look like a model, we can't check permissions.
         if not model_klass or not getattr(model_klass, '_meta', None):
@@ -168,7 +192,9 @@ class DjangoAuthorization(Authorization):
         return True
 
     def create_list(self, object_list, bundle):
-        klass = self.base_checks(bundle.request, object_list.model)
+        # ``object_list`` may be a plain list of new objects (see
+        # ``create_list_accepts_objects``).
+        klass = self.base_checks(bundle.request, getattr(object_list, 'model', bundle.obj.__class__))
 
         if klass is False:
             return []
@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
 from builtins import object
+import time
+
 from tastypie.utils import IS_DJANGO_1_4
 
 if IS_DJANGO_1_4:
@@ -38,6 +40,21 @@ class NoCache(object):
         """
         pass
 
+    def get_generations(self, namespaces):
+        """
+        Returns the current generation of each of the ``namespaces``, to be
+        embedded in cache keys.
+
+        Always ``None``, which leaves keys unversioned.
+        """
+        return [None for namespace in namespaces]
+
+    def bump_generation(self, namespace):
+        """
+        No-op for invalidating a namespace.
+        """
+        pass
+
     def cacheable(self, request, response):
         """
         Returns True or False if the request -> response is capable of being
@@ -93,6 +110,55 @@ class SimpleCache(NoCache):
 
         self.cache.set(key, value, timeout)
 
+    def generation_key(self, namespace):
+        return 'tastypie:generation:%s' % namespace
+
+    def new_generation(self):
+        """
+        The starting point of a new (or evicted) counter. Time-based, so a
+        lost counter doesn't come back with a value old keys were built with.
+        """
+        return int(time.time() * 1000)
+
+    def get_generations(self, namespaces):
+        """
+        Returns the current generation of each of the ``namespaces``, fetched
+        in one ``get_many``. Missing counters are started with ``add``, so
+        concurrent requests agree on the winner's value.
+        """
+        keys = [self.generation_key(namespace) for namespace in namespaces]
+        generations = self.cache.get_many(keys)
+
+        for key in keys:
+            if key not in generations:
+                generation = self.new_generation()
+
+                if not self.cache.add(key, generation, None):
+                    generation = self.cache.get(key, generation)
+
+                generations[key] = generation
+
+        return [generations[key] for key in keys]
+
+    def bump_generation(self, namespace):
+        """
+        Atomically increments the generation of ``namespace``, which orphans
+        every key built with the old one.
+        """
+        key = self.generation_key(namespace)
+
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # The counter is missing. Start a fresh one, unless another
+            # process beat us to it.
+            generation = self.new_generation()
+
+            if self.cache.add(key, generation, None):
+                return generation
+
+            return self.cache.incr(key)
+
     def cache_control(self):
         control = {
             'max_age': self.timeout,
@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 from tastypie.bundle import Bundle
 from tastypie.resources import ModelResource
 from tastypie.exceptions import NotFound
+from tastypie.utils import urlconf_cache_key, UriTrie
 from django.urls import resolve, Resolver404, get_script_prefix
 
 
@@ -11,9 +12,50 @@ class GenericResource(ModelResource):
     """
     def __init__(self, resources, *args, **kwargs):
         self.resource_mapping = dict((r._meta.resource_name, r) for r in resources)
+        self._uri_tries = {}
         return super(GenericResource, self).__init__(*args, **kwargs)
 
 
+    def get_uri_trie(self):
+        """
+        Returns a ``UriTrie`` mapping the list URI of every resource in
+        ``resource_mapping`` to an instance of it, built once per URLconf.
+        """
+        cache_key = (urlconf_cache_key(), self._meta.api_name)
+
+        try:
+            return self._uri_tries[cache_key]
+        except KeyError:
+            pass
+
+        trie = UriTrie()
+
+        for resource_class in self.resource_mapping.values():
+            resource = resource_class(api_name=self._meta.api_name)
+            list_uri = resource.get_resource_uri()
+
+            if list_uri:
+                trie.add(list_uri, resource)
+
+        self._uri_tries[cache_key] = trie
+        return trie
+
+    def resource_for_uri(self, uri):
+        """
+        Returns a ``(resource, kwargs)`` pair for a detail URI of one of the
+        mapped resources, without going through ``resolve``, or
+        ``(None, None)`` if that's not possible.
+        """
+        resource = self.get_uri_trie().lookup(uri)
+
+        if resource is not None:
+            kwargs = resource.parse_detail_uri(uri)
+
+            if kwargs is not None:
+                return resource, kwargs
+
+        return None, None
+
     def build_bundle(self, obj=None, data=None, request=None, objects_saved=None):
         if obj is None:
             if data is None or 'resource_uri' not in data:
@@ -21,6 +63,12 @@ class GenericResource(ModelResource):
             else:
                 uri = data['resource_uri']
                 chomped_uri = self.get_chomped_uri(uri)
+
+            resource, kwargs = self.resource_for_uri(uri)
+
+            if resource is not None:
+                return resource.build_bundle(obj, data, request, objects_saved)
+
             try:
                 view, args, kwargs = resolve(chomped_uri)
                 resource_name = kwargs['resource_name']
@@ -53,6 +101,12 @@ class GenericResource(ModelResource):
         If you need custom behavior based on other portions of the URI,
         simply override this method.
         """
+        resource, kwargs = self.resource_for_uri(uri)
+
+        if resource is not None:
+            bundle = resource.build_bundle(request=request)
+            return resource.obj_get(bundle, **{resource._meta.detail_uri_name: kwargs[resource._meta.detail_uri_name]})
+
         chomped_uri = self.get_chomped_uri(uri)
         try:
             view, args, kwargs = resolve(chomped_uri)
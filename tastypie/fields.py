@@ -2,9 +2,11 @@ from __future__ import unicode_literals
 from builtins import str
 from past.builtins import basestring
 from builtins import object
+from collections import OrderedDict
 import datetime
 from dateutil.parser import parse
 from decimal import Decimal
+import operator
 import re
 from django import forms
 
@@ -27,6 +29,40 @@ DATE_REGEX = re.compile('^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2}).*?$')
 DATETIME_REGEX = re.compile('^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})(T|\s+)(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}).*?$')
 
 
+class AttributeAccessor(object):
+    """
+    A compiled form of an ``ApiField.attribute`` string.
+
+    The ``attribute`` is split on ``__`` once, up front, into ``path``. Calling
+    the accessor walks that path off an object via a single
+    ``operator.attrgetter``, raising ``AttributeError`` (or whatever the
+    descriptor raises, like ``ObjectDoesNotExist``) if any step is missing.
+    Fields fall back to walking ``path`` themselves only to apply their
+    null/default rules.
+
+    ``lookups`` holds the ORM-style prefixes of the path (i.e. ``author``,
+    ``author__user``), as used by ``select_related``/``prefetch_related``.
+    """
+    def __init__(self, attribute):
+        self.attribute = attribute
+        self.path = ()
+        self.lookups = ()
+        self._getter = None
+
+        if isinstance(attribute, six.string_types):
+            self.path = tuple(attribute.split('__'))
+            self.lookups = tuple('__'.join(self.path[:i + 1]) for i in range(len(self.path)))
+
+            if all(self.path):
+                self._getter = operator.attrgetter('.'.join(self.path))
+
+    def __call__(self, obj):
+        if self._getter is None:
+            raise AttributeError("'%s' can not be compiled to an accessor." % (self.attribute,))
+
+        return self._getter(obj)
+
+
 class AllowEverythingMultipleChoiceField(forms.MultipleChoiceField):
     def clean(self, value):
         if type(value) ==list:
@@ -129,6 +165,30 @@ class ApiField(object):
         # morning.
         self.instance_name = name
         self._resource = cls
+        self.compile_attribute()
+
+    def compile_attribute(self):
+        """
+        Compiles ``attribute`` into the ``AttributeAccessor`` returned by
+        ``attribute_accessor``.
+        """
+        self._attribute_accessor = AttributeAccessor(self.attribute)
+        return self._attribute_accessor
+
+    @property
+    def attribute_accessor(self):
+        """
+        Returns the compiled ``AttributeAccessor`` for ``attribute``.
+
+        Compiled once in ``contribute_to_class``, recompiled if ``attribute``
+        has been reassigned since.
+        """
+        accessor = getattr(self, '_attribute_accessor', None)
+
+        if accessor is None or accessor.attribute is not self.attribute:
+            accessor = self.compile_attribute()
+
+        return accessor
 
     def has_default(self):
         """Returns a boolean of whether this field has a default value."""
@@ -148,27 +208,16 @@ class ApiField(object):
         resource.
         """
         if self.attribute is not None:
-            # Check for `__` in the field for looking through the relation.
-            attrs = self.attribute.split('__')
-            current_object = bundle.obj
-
-            for attr in attrs:
-                previous_object = current_object
-                current_object = getattr(current_object, attr, None)
-
-                if current_object is None:
-                    if self.has_default():
-                        current_object = self._default
-                        # Fall out of the loop, given any further attempts at
-                        # accesses will fail miserably.
-                        break
-                    elif self.null:
-                        current_object = None
-                        # Fall out of the loop, given any further attempts at
-                        # accesses will fail miserably.
-                        break
-                    else:
-                        raise ApiFieldError("The object '%r' has an empty attribute '%s' and doesn't allow a default or null value." % (previous_object, attr))
+            accessor = self.attribute_accessor
+
+            try:
+                current_object = accessor(bundle.obj)
+            except AttributeError:
+                current_object = None
+
+            if current_object is None:
+                # Walk the relation by hand to apply the default/null rules.
+                current_object = self._dehydrate_path(bundle.obj, accessor.path)
 
             if callable(current_object):
                 current_object = current_object()
@@ -180,6 +229,27 @@ class ApiField(object):
         else:
             return None
 
+    def _dehydrate_path(self, current_object, attrs):
+        for attr in attrs:
+            previous_object = current_object
+            current_object = getattr(current_object, attr, None)
+
+            if current_object is None:
+                if self.has_default():
+                    current_object = self._default
+                    # Fall out of the loop, given any further attempts at
+                    # accesses will fail miserably.
+                    break
+                elif self.null:
+                    current_object = None
+                    # Fall out of the loop, given any further attempts at
+                    # accesses will fail miserably.
+                    break
+                else:
+                    raise ApiFieldError("The object '%r' has an empty attribute '%s' and doesn't allow a default or null value." % (previous_object, attr))
+
+        return current_object
+
     def convert(self, value):
         """
         Handles conversion between the data found and the type of the field.
@@ -620,6 +690,40 @@ class RelatedField(ApiField):
         related_resource.instance = related_instance
         return related_resource
 
+    def get_request_related_resource(self, related_instance, bundle):
+        """
+        Returns the related resource to dehydrate ``related_instance`` with.
+
+        One resource is shared by every object this field dehydrates within
+        ``bundle.request``, keyed on the field, the related instance's class &
+        the parent context (see ``get_related_resource_context``). Pass the
+        related instance to ``dehydrate_related`` explicitly, as the shared
+        resource's ``instance`` is only the first one.
+        """
+        context = self.get_related_resource_context(bundle)
+
+        if bundle.request is None or context is NOT_PROVIDED:
+            return self.get_related_resource(related_instance, bundle)
+
+        related_resources = bundle.request.__dict__.setdefault('_tastypie_related_resources', {})
+        key = (self, type(related_instance), context)
+
+        try:
+            return related_resources[key]
+        except KeyError:
+            related_resources[key] = self.get_related_resource(related_instance, bundle)
+            return related_resources[key]
+
+    def get_related_resource_context(self, bundle):
+        """
+        Returns what, besides the field & the related class, the related
+        resource depends on for ``bundle``. ``NOT_PROVIDED`` means it can't
+        be shared.
+
+        Plain related resources don't depend on the parent, so ``None``.
+        """
+        return None
+
     @property
     def to_class(self):
         # We need to be lazy here, because when the metaclass constructs the
@@ -650,14 +754,19 @@ class RelatedField(ApiField):
 
         return self._to_class
 
-    def dehydrate_related(self, bundle, related_resource, for_list=False):
+    def dehydrate_related(self, bundle, related_resource, for_list=False, related_instance=None):
         """
         Based on the ``full_resource``, returns either the endpoint or the data
         from ``full_dehydrate`` for the related resource.
+
+        ``related_instance`` defaults to ``related_resource.instance``.
         """
+        if related_instance is None:
+            related_instance = related_resource.instance
+
         should_dehydrate_full_resource = self.should_full_dehydrate(bundle, for_list=for_list)
         related_bundle = related_resource.build_bundle(
-                obj=related_resource.instance,
+                obj=related_instance,
                 request=bundle.request,
                 objects_saved=bundle.objects_saved
             )
@@ -870,17 +979,26 @@ class ToOneField(RelatedField):
 
     def dehydrate(self, bundle, for_list=False):
         foreign_obj = None
+        previous_obj = bundle.obj
+        attr = self.attribute
 
         if isinstance(self.attribute, six.string_types):
-            attrs = self.attribute.split('__')
-            foreign_obj = bundle.obj
+            accessor = self.attribute_accessor
 
-            for attr in attrs:
-                previous_obj = foreign_obj
-                try:
-                    foreign_obj = getattr(foreign_obj, attr, None)
-                except ObjectDoesNotExist:
-                    foreign_obj = None
+            try:
+                foreign_obj = accessor(bundle.obj)
+            except (AttributeError, ObjectDoesNotExist):
+                foreign_obj = None
+
+            if not foreign_obj:
+                foreign_obj = bundle.obj
+
+                for attr in accessor.path:
+                    previous_obj = foreign_obj
+                    try:
+                        foreign_obj = getattr(foreign_obj, attr, None)
+                    except ObjectDoesNotExist:
+                        foreign_obj = None
         elif callable(self.attribute):
             foreign_obj = self.attribute(bundle)
 
@@ -893,9 +1011,9 @@ class ToOneField(RelatedField):
 
             return None
 
-        self.fk_resource = self.get_related_resource(foreign_obj, bundle)
+        self.fk_resource = self.get_request_related_resource(foreign_obj, bundle)
         #fk_bundle = self.fk_resource.build_bundle(obj=foreign_obj, request=bundle.request)
-        return self.dehydrate_related(bundle, self.fk_resource, for_list=for_list)
+        return self.dehydrate_related(bundle, self.fk_resource, for_list=for_list, related_instance=foreign_obj)
 
     def hydrate(self, bundle):
         value = super(ToOneField, self).hydrate(bundle)
@@ -973,7 +1091,13 @@ class ToManyField(RelatedField):
     def __init__(self, to, attribute, related_name=None, default=NOT_PROVIDED,
                  null=False, blank=False, readonly=False, full=False,
                  unique=False, help_text=None, use_in='all', full_list=True,
-                 full_detail=True, change_handler=None):
+                 full_detail=True, change_handler=None, bulk_through=False):
+        """
+        Optionally accepts ``bulk_through``. If ``True``, new rows of a
+        many-to-many relation are inserted into the through model with a
+        single ``bulk_create``, skipping the ``m2m_changed`` signals & the
+        existing-row check of ``add``. Defaults to ``False``.
+        """
         super(ToManyField, self).__init__(
             to, attribute, related_name=related_name, default=default,
             null=null, blank=blank, readonly=readonly, full=full,
@@ -982,6 +1106,7 @@ class ToManyField(RelatedField):
             change_handler=change_handler
         )
         self.m2m_bundles = []
+        self.bulk_through = bulk_through
 
 
     def build_schema(self, **kwargs):
@@ -1008,18 +1133,10 @@ class ToManyField(RelatedField):
         attr = self.attribute
 
         if isinstance(self.attribute, six.string_types):
-            attrs = self.attribute.split('__')
-            the_m2ms = bundle.obj
-
-            for attr in attrs:
-                previous_obj = the_m2ms
-                try:
-                    the_m2ms = getattr(the_m2ms, attr, None)
-                except ObjectDoesNotExist:
-                    the_m2ms = None
+            the_m2ms = self.get_m2ms(bundle)
 
-                if not the_m2ms:
-                    break
+            if not the_m2ms:
+                previous_obj, attr = self.get_m2ms_failure(bundle)
 
         elif callable(self.attribute):
             the_m2ms = self.attribute(bundle)
@@ -1036,12 +1153,43 @@ class ToManyField(RelatedField):
         # TODO: Also model-specific and leaky. Relies on there being a
         #       ``Manager`` there
         for m2m in the_m2ms.all():
-            m2m_resource = self.get_related_resource(m2m, bundle)
-            #m2m_bundle = m2m_resource.build_bundle(obj=m2m, request=bundle.request)
+            m2m_resource = self.get_request_related_resource(m2m, bundle)
             self.m2m_resources.append(m2m_resource)
-            m2m_dehydrated.append(self.dehydrate_related(bundle, m2m_resource, for_list=for_list))
+            m2m_dehydrated.append(self.dehydrate_related(bundle, m2m_resource, for_list=for_list, related_instance=m2m))
         return m2m_dehydrated
 
+    def get_m2ms(self, bundle):
+        """
+        Returns the related manager found at the (string) ``attribute`` off
+        ``bundle.obj``, or ``None`` if any step of the path is empty.
+        """
+        try:
+            return self.attribute_accessor(bundle.obj)
+        except (AttributeError, ObjectDoesNotExist):
+            return None
+
+    def get_m2ms_failure(self, bundle):
+        """
+        Walks ``attribute`` off ``bundle.obj`` step by step, returning the
+        object & attribute name where the path came up empty. Only used for
+        error reporting.
+        """
+        the_m2ms = bundle.obj
+        previous_obj = bundle.obj
+        attr = self.attribute
+
+        for attr in self.attribute_accessor.path:
+            previous_obj = the_m2ms
+            try:
+                the_m2ms = getattr(the_m2ms, attr, None)
+            except ObjectDoesNotExist:
+                the_m2ms = None
+
+            if not the_m2ms:
+                break
+
+        return previous_obj, attr
+
     def hydrate(self, bundle):
         pass
 
@@ -1062,10 +1210,20 @@ class ToManyField(RelatedField):
         value_list = bundle.data.get(self.instance_name)
         if not isinstance(value_list,list):
             raise ApiFieldError("The '%s' field has to be list." % self.instance_name)
+
+        uri_objects, fk_resource = self.get_objs_via_uris(bundle, value_list)
+
         for value in value_list:
             if value is None:
                 continue
 
+            if isinstance(value, six.string_types) and value in uri_objects:
+                related_bundle = fk_resource.build_bundle(obj=uri_objects[value], request=bundle.request)
+                # Pulled from a URI, so there's nothing to save.
+                bundle.objects_saved.add(fk_resource.create_identifier(related_bundle.obj))
+                m2m_hydrated.append(related_bundle)
+                continue
+
             kwargs = {
                 'request': bundle.request,
                 'orig_bundle' : bundle
@@ -1079,16 +1237,30 @@ class ToManyField(RelatedField):
         return m2m_hydrated
 
 
+    def get_objs_via_uris(self, bundle, value_list):
+        """
+        Loads the objects of all the URIs in ``value_list`` through the related
+        resource's ``get_via_uris``, in one go. Returns a dictionary of URI to
+        object & the related resource, which is kept as ``fk_resource`` too.
+
+        The bundles built from these objects carry no dehydrated data, as
+        they're only there to be related.
+        """
+        uris = [value for value in value_list if isinstance(value, six.string_types)]
+
+        if not uris:
+            return {}, None
+
+        self.fk_resource = self.get_related_resource(bundle.obj if self.related_name else None, bundle)
+        return self.fk_resource.get_via_uris(uris, request=bundle.request), self.fk_resource
+
     def get_related_mngr(self, bundle):
         related_mngr = None
         if isinstance(self.attribute, basestring):
-            current_obj = bundle.obj
-            for attr in self.attribute.split('__'):
-                try:
-                    current_obj = getattr(current_obj, attr)
-                    related_mngr = current_obj
-                except ObjectDoesNotExist:
-                    return None
+            try:
+                related_mngr = self.attribute_accessor(bundle.obj)
+            except ObjectDoesNotExist:
+                return None
         elif callable(self.attribute):
             related_mngr = self.attribute(bundle)
 
@@ -1120,19 +1292,55 @@ class ToManyField(RelatedField):
 
 
     def save(self, bundle):
+        """
+        Brings the relation in line with the hydrated objects.
+
+        The current pks are fetched once, then the difference is applied with
+        a single ``remove`` & a single ``add`` (or ``bulk_create`` on the
+        through model, with ``bulk_through``).
+        """
         related_mngr = self.get_related_mngr(bundle)
         if not related_mngr:
             return
 
-        related_objs = self.get_related_objs(bundle)
+        related_objs = OrderedDict((obj.pk, obj) for obj in self.get_related_objs(bundle))
+        current_pks = set(related_mngr.values_list('pk', flat=True))
+        is_m2m_mngr = hasattr(related_mngr, 'through')
+
+        removed_pks = current_pks.difference(related_objs)
+
+        if removed_pks:
+            if is_m2m_mngr:
+                related_mngr.remove(*removed_pks)
+            else:
+                # Reverse foreign key managers only take instances.
+                related_mngr.remove(*related_mngr.filter(pk__in=removed_pks))
+
+        added = [obj for pk, obj in related_objs.items() if pk not in current_pks]
 
-        for obj in related_mngr.all():
-            if obj not in related_objs:
-                related_mngr.remove(obj)
+        if not added:
+            return
 
-        for obj in related_objs:
-            if obj not in related_mngr.all():
-                related_mngr.add(obj)
+        if self.bulk_through and is_m2m_mngr:
+            self.bulk_add_through(related_mngr, added)
+        else:
+            related_mngr.add(*added)
+
+    def bulk_add_through(self, related_mngr, objs):
+        """
+        Links ``objs`` with one ``bulk_create`` of through model rows.
+        """
+        through = related_mngr.through
+        source_field = through._meta.get_field(related_mngr.source_field_name)
+        target_field = through._meta.get_field(related_mngr.target_field_name)
+        source_value = getattr(related_mngr.instance, source_field.target_field.attname)
+        through._default_manager.bulk_create([
+            through(**{
+                source_field.attname: source_value,
+                target_field.attname: getattr(obj, target_field.target_field.attname),
+            })
+            for obj in objs
+        ])
 
 
 
@@ -1164,6 +1372,16 @@ class BaseSubResourceField(object):
 
         return related_resource
 
+    def get_related_resource_context(self, bundle):
+        """
+        Sub-resources depend on the parent object, so they're only shared
+        among the related objects of one (saved) parent.
+        """
+        if bundle.obj is None or bundle.obj.pk is None:
+            return NOT_PROVIDED
+
+        return (type(bundle.obj), bundle.obj.pk)
+
 
 class ToOneSubResourceField(BaseSubResourceField, ToOneField):
     def __init__(self, *args, **kwargs):
@@ -1242,18 +1460,10 @@ class ToManySubResourceField(BaseSubResourceField, ToManyField):
         attr = self.attribute
 
         if isinstance(self.attribute, basestring):
-            attrs = self.attribute.split('__')
-            the_m2ms = bundle.obj
+            the_m2ms = self.get_m2ms(bundle)
 
-            for attr in attrs:
-                previous_obj = the_m2ms
-                try:
-                    the_m2ms = getattr(the_m2ms, attr, None)
-                except ObjectDoesNotExist:
-                    the_m2ms = None
-
-                if not the_m2ms:
-                    break
+            if not the_m2ms:
+                previous_obj, attr = self.get_m2ms_failure(bundle)
 
         elif callable(self.attribute):
             the_m2ms = self.attribute(bundle)
@@ -1273,10 +1483,10 @@ class ToManySubResourceField(BaseSubResourceField, ToManyField):
         authorized_object_list = related_resource.authorized_read_list(the_m2ms.all(), bundle)
 
         for m2m in authorized_object_list:
-            m2m_resource = self.get_related_resource(m2m, bundle)
+            m2m_resource = self.get_request_related_resource(m2m, bundle)
             #m2m_bundle = m2m_resource.build_bundle(obj=m2m, request=bundle.request)
             self.m2m_resources.append(m2m_resource)
-            m2m_dehydrated.append(self.dehydrate_related(bundle, m2m_resource, for_list=for_list))
+            m2m_dehydrated.append(self.dehydrate_related(bundle, m2m_resource, for_list=for_list, related_instance=m2m))
         return m2m_dehydrated
 
 
@@ -0,0 +1,29 @@
+from __future__ import print_function
+from __future__ import unicode_literals
+from collections import Counter
+from django.core.management.base import BaseCommand
+from tastypie.throttle import ApiAccessQueue
+
+
+class Command(BaseCommand):
+    help = "Writes the API accesses queued by ``BufferedCacheDBThrottle`` to the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, dest='batch_size',
+                            help="The number of records to insert per query.")
+        parser.add_argument('--key-prefix', default='tastypie_api_access', dest='key_prefix',
+                            help="The cache key prefix of the queue.")
+
+    def handle(self, **options):
+        """Drains the queue & reports the accesses written per identifier."""
+        self.verbosity = int(options.get('verbosity', 1))
+        queue = ApiAccessQueue(key_prefix=options.get('key_prefix', 'tastypie_api_access'))
+        accesses = queue.drain(batch_size=options.get('batch_size', 500))
+
+        if self.verbosity >= 1:
+            counts = Counter(access.identifier for access in accesses)
+
+            for identifier, count in sorted(counts.items()):
+                print(u"%s: %d" % (identifier, count))
+
+            print(u"Wrote %d API accesses." % len(accesses))
@@ -61,3 +61,17 @@ if 'django.contrib.auth' in settings.INSTALLED_APPS:
         """
         if kwargs.get('created') is True:
             ApiKey.objects.create(user=kwargs.get('instance'))
+
+
+    def invalidate_api_key_cache(sender, instance, **kwargs):
+        """
+        A signal for dropping the credentials ``ApiKeyAuthentication`` has
+        cached for a changed or deleted ``ApiKey``.
+        """
+        from tastypie.authentication import invalidate_cached_api_key
+        invalidate_cached_api_key(instance)
+
+
+    if not ApiKey._meta.abstract:
+        models.signals.post_save.connect(invalidate_api_key_cache, sender=ApiKey)
+        models.signals.post_delete.connect(invalidate_api_key_cache, sender=ApiKey)
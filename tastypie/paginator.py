@@ -3,7 +3,20 @@ from __future__ import unicode_literals
 from future import standard_library
 standard_library.install_aliases()
 from builtins import object
+import base64
+import binascii
+import datetime
+import decimal
+import hashlib
+import json
+import operator
+import uuid
+from functools import reduce
 from django.conf import settings
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured, ValidationError
+from django.db import connections
+from django.db.models import Model, Q
+from django.db.models.constants import LOOKUP_SEP
 import six
 
 from tastypie.exceptions import BadRequest
@@ -14,6 +27,9 @@ except ImportError:
     from urllib.parse import urlencode
 
 
+COUNT_STRATEGIES = ('exact', 'cached', 'estimate', 'none')
+
+
 class Paginator(object):
     """
     Limits result sets down to sane amounts for passing to the client.
@@ -26,7 +42,8 @@ class Paginator(object):
     ``total_count`` of resources seen and convenience links to the
     ``previous``/``next`` pages of data as available.
     """
-    def __init__(self, request_data, objects, resource_uri=None, limit=None, offset=0, max_limit=1000, collection_name='objects'):
+    def __init__(self, request_data, objects, resource_uri=None, limit=None, offset=0, max_limit=1000, collection_name='objects',
+                 count_strategy='exact', cache=None, cache_key=None, count_timeout=None):
         """
         Instantiates the ``Paginator`` and allows for some configuration.
 
@@ -47,6 +64,13 @@ class Paginator(object):
         Optionally accepts a ``max_limit`` argument, which the upper bound
         limit. Defaults to ``1000``. If you set it to 0 or ``None``, no upper
         bound will be enforced.
+
+        Optionally accepts a ``count_strategy`` argument, which decides how
+        ``total_count`` is found. One of ``exact`` (the default), ``cached``
+        (an exact count, memoized in ``cache`` under ``cache_key`` for
+        ``count_timeout`` seconds), ``estimate`` (the database's statistics
+        for unfiltered lists, otherwise exact) or ``none`` (``total_count``
+        is left out).
         """
         self.request_data = request_data
         self.objects = objects
@@ -55,6 +79,13 @@ class Paginator(object):
         self.offset = offset
         self.resource_uri = resource_uri
         self.collection_name = collection_name
+        self.count_strategy = count_strategy
+        self.cache = cache
+        self.cache_key = cache_key
+        self.count_timeout = count_timeout
+
+        if count_strategy not in COUNT_STRATEGIES:
+            raise ImproperlyConfigured("Unknown count strategy '%s'. Choose from: %s." % (count_strategy, ', '.join(COUNT_STRATEGIES)))
 
     def get_limit(self):
         """
@@ -123,7 +154,23 @@ class Paginator(object):
 
     def get_count(self):
         """
-        Returns a count of the total number of objects seen.
+        Returns a count of the total number of objects seen, as found by the
+        ``count_strategy``.
+        """
+        if self.count_strategy == 'cached':
+            return self.get_cached_count()
+
+        if self.count_strategy == 'estimate':
+            count = self.get_estimated_count()
+
+            if count is not None:
+                return count
+
+        return self.get_exact_count()
+
+    def get_exact_count(self):
+        """
+        Counts the objects, with ``COUNT(*)`` for a ``QuerySet``.
         """
         try:
             return self.objects.count()
@@ -131,6 +178,67 @@ class Paginator(object):
             # If it's not a QuerySet (or it's ilk), fallback to ``len``.
             return len(self.objects)
 
+    def get_cached_count(self):
+        """
+        Returns the exact count, memoized in the ``cache``.
+
+        The key is built from the ``cache_key`` & a hash of the count's SQL,
+        so it follows the filters (authorization included) but not the
+        ordering or the page.
+        """
+        if self.cache is None:
+            return self.get_exact_count()
+
+        try:
+            sql = self.objects.order_by().query.sql_with_params()
+        except AttributeError:
+            return self.get_exact_count()
+        except EmptyResultSet:
+            return 0
+
+        digest = hashlib.md5(repr(sql).encode('utf-8')).hexdigest()
+        cache_key = '%s:%s' % (self.cache_key or 'count', digest)
+        count = self.cache.get(cache_key)
+
+        if count is None:
+            count = self.get_exact_count()
+            self.cache.set(cache_key, count, self.count_timeout)
+
+        return count
+
+    def get_estimated_count(self):
+        """
+        Returns the row count the database keeps in its statistics for an
+        unfiltered ``QuerySet`` (on PostgreSQL & MySQL), or ``None`` if there
+        is no estimate to use.
+        """
+        query = getattr(self.objects, 'query', None)
+
+        if query is None or query.where or query.distinct or query.is_sliced:
+            return None
+
+        connection = connections[self.objects.db]
+        table = query.get_meta().db_table
+
+        if connection.vendor == 'postgresql':
+            sql = "SELECT reltuples FROM pg_class WHERE oid = %s::regclass"
+            params = [connection.ops.quote_name(table)]
+        elif connection.vendor == 'mysql':
+            sql = "SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s"
+            params = [table]
+        else:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+
+        # Tables that were never analyzed have no (or a negative) estimate.
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+
+        return int(row[0])
+
     def get_previous(self, limit, offset):
         """
         If a previous page is available, will generate a URL to request that
@@ -151,18 +259,23 @@ class Paginator(object):
 
         return self._generate_uri(limit, offset+limit)
 
-    def _generate_uri(self, limit, offset):
+    def _generate_uri(self, limit, offset, cursor=None):
         if self.resource_uri is None:
             return None
 
+        # Either page by ``offset`` or by ``cursor``.
+        if cursor is None:
+            page_params = {'limit': limit, 'offset': offset}
+        else:
+            page_params = {'limit': limit, 'cursor': cursor}
+
         try:
             # QueryDict has a urlencode method that can handle multiple values for the same key
             request_params = self.request_data.copy()
-            if 'limit' in request_params:
-                del request_params['limit']
-            if 'offset' in request_params:
-                del request_params['offset']
-            request_params.update({'limit': limit, 'offset': offset})
+            for key in ('limit', 'offset', 'cursor'):
+                if key in request_params and (key != 'cursor' or cursor is not None):
+                    del request_params[key]
+            request_params.update(page_params)
             encoded_params = request_params.urlencode()
         except AttributeError:
             request_params = {}
@@ -173,11 +286,10 @@ class Paginator(object):
                 else:
                     request_params[k] = v
 
-            if 'limit' in request_params:
-                del request_params['limit']
-            if 'offset' in request_params:
-                del request_params['offset']
-            request_params.update({'limit': limit, 'offset': offset})
+            for key in ('limit', 'offset', 'cursor'):
+                if key in request_params and (key != 'cursor' or cursor is not None):
+                    del request_params[key]
+            request_params.update(page_params)
             encoded_params = urlencode(request_params)
 
         return '%s?%s' % (
@@ -194,14 +306,25 @@ class Paginator(object):
         """
         limit = self.get_limit()
         offset = self.get_offset()
-        count = self.get_count()
-        objects = self.get_slice(limit, offset)
         meta = {
             'offset': offset,
             'limit': limit,
-            'total_count': count,
         }
 
+        if self.count_strategy == 'none':
+            # Fetch one extra object to find out if there's a next page.
+            count = None
+            objects = self.get_slice(limit and limit + 1, offset)
+
+            if limit:
+                objects = list(objects)
+                count = offset + len(objects)
+                objects = objects[:limit]
+        else:
+            count = self.get_count()
+            objects = self.get_slice(limit, offset)
+            meta['total_count'] = count
+
         if limit:
             meta['previous'] = self.get_previous(limit, offset)
             meta['next'] = self.get_next(limit, offset, count)
@@ -210,3 +333,167 @@ class Paginator(object):
             self.collection_name: objects,
             'meta': meta,
         }
+
+
+class CursorPaginator(Paginator):
+    """
+    Pages through a ``QuerySet`` by keyset ("cursor") instead of
+    ``offset``, so deep pages cost the same as the first one & no
+    ``COUNT(*)`` is run.
+
+    The ``next``/``previous`` links carry an opaque ``cursor`` holding the
+    ordering values of the last/first object on the page. The queryset's
+    ordering (from ``order_by`` or the model's ``Meta.ordering``) is used,
+    with the primary key appended as a tie-breaker. Ordering fields should be
+    plain, non-null columns. ``offset`` & ``total_count`` are always
+    ``None``.
+    """
+    def get_ordering(self):
+        """
+        Returns the ``(field_name, descending)`` pairs the page is ordered by,
+        ending with the primary key.
+        """
+        try:
+            query = self.objects.query
+        except AttributeError:
+            raise ImproperlyConfigured("The CursorPaginator requires a QuerySet, not %r." % type(self.objects))
+
+        ordering = list(query.order_by)
+
+        if not ordering and query.default_ordering:
+            ordering = list(query.get_meta().ordering)
+
+        keys = []
+
+        for order_by in ordering:
+            if not isinstance(order_by, six.string_types) or order_by.lstrip('-') in ('', '?'):
+                raise ImproperlyConfigured("The CursorPaginator can't page by the ordering %r." % order_by)
+
+            keys.append((order_by.lstrip('-'), order_by.startswith('-')))
+
+        pk = query.get_meta().pk
+
+        if not [name for name, descending in keys if name in ('pk', pk.name, pk.attname)]:
+            keys.append(('pk', False))
+
+        return keys
+
+    def get_cursor(self, keys):
+        """
+        Decodes the user-provided ``cursor`` from the GET parameters into a
+        ``(direction, values)`` pair, or returns ``None`` if there isn't one.
+        """
+        cursor = self.request_data.get('cursor')
+
+        if not cursor:
+            return None
+
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(str(cursor + padding)).decode('utf-8'))
+            direction, values = data['d'], data['v']
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise BadRequest("Invalid cursor '%s' provided." % cursor)
+
+        if direction not in ('next', 'previous') or not isinstance(values, list) or len(values) != len(keys):
+            raise BadRequest("Invalid cursor '%s' provided." % cursor)
+
+        return direction, values
+
+    def encode_cursor(self, direction, obj, keys):
+        """
+        Builds an opaque cursor pointing past ``obj`` in ``direction``.
+        """
+        values = [self._get_value(obj, name) for name, descending in keys]
+        data = json.dumps({'d': direction, 'v': values}, default=self._encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def _get_value(self, obj, name):
+        value = obj
+
+        for attr in name.split(LOOKUP_SEP):
+            value = getattr(value, attr)
+
+        if isinstance(value, Model):
+            value = value.pk
+
+        return value
+
+    def _encode_value(self, value):
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+
+        if isinstance(value, (decimal.Decimal, uuid.UUID)):
+            return str(value)
+
+        raise TypeError("%r can't be used in a cursor." % value)
+
+    def get_slice_after(self, keys, cursor, limit):
+        """
+        Returns up to ``limit + 1`` objects past the cursor (or from the
+        start), in page order, along with whether more objects lie beyond.
+        """
+        backwards = cursor is not None and cursor[0] == 'previous'
+        objects = self.objects.order_by(*[
+            ('-' if descending != backwards else '') + name for name, descending in keys
+        ])
+
+        if cursor is not None:
+            clauses = []
+
+            for i, (name, descending) in enumerate(keys):
+                lookup = 'lt' if descending != backwards else 'gt'
+                clause = dict((keys[j][0], cursor[1][j]) for j in range(i))
+                clause['%s__%s' % (name, lookup)] = cursor[1][i]
+                clauses.append(Q(**clause))
+
+            # Values that don't fit the fields (a tampered cursor) fail here.
+            try:
+                objects = objects.filter(reduce(operator.or_, clauses))
+            except (TypeError, ValueError, ValidationError):
+                raise BadRequest("Invalid cursor '%s' provided." % self.request_data.get('cursor'))
+
+        if not limit:
+            return objects, False
+
+        objects = list(objects[:limit + 1])
+        has_more = len(objects) > limit
+        objects = objects[:limit]
+
+        if backwards:
+            objects.reverse()
+
+        return objects, has_more
+
+    def page(self):
+        """
+        Generates all pertinent data about the requested page.
+
+        Fetches one object more than the ``limit`` to find out whether there
+        is another page, rather than counting the whole result set.
+        """
+        limit = self.get_limit()
+        keys = self.get_ordering()
+        cursor = self.get_cursor(keys)
+        objects, has_more = self.get_slice_after(keys, cursor, limit)
+        meta = {
+            'offset': None,
+            'limit': limit,
+            'total_count': None,
+        }
+
+        if limit:
+            backwards = cursor is not None and cursor[0] == 'previous'
+            meta['previous'] = None
+            meta['next'] = None
+
+            if objects and (has_more if backwards else cursor is not None):
+                meta['previous'] = self._generate_uri(limit, None, self.encode_cursor('previous', objects[0], keys))
+
+            if objects and (backwards or has_more):
+                meta['next'] = self._generate_uri(limit, None, self.encode_cursor('next', objects[-1], keys))
+
+        return {
+            self.collection_name: objects,
+            'meta': meta,
+        }
@@ -4,7 +4,10 @@ from past.builtins import basestring
 from builtins import object
 import simplejson
 from copy import deepcopy
+import datetime
+import hashlib
 import logging
+import re
 import warnings
 
 from django.conf import settings
@@ -20,7 +23,8 @@ from django.core.exceptions import (
 )
 from django.urls import NoReverseMatch, reverse, resolve, Resolver404, get_script_prefix, reverse_lazy
 from django.core.signals import got_request_exception
-from django.db import transaction
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, QuerySet, prefetch_related_objects
 try:
     from django.db.models.constants import LOOKUP_SEP
 except ImportError:
@@ -28,6 +32,7 @@ except ImportError:
 
 from django.http import HttpResponse, HttpResponseNotFound, Http404
 from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
 import six
 
 from tastypie.authentication import Authentication
@@ -41,9 +46,9 @@ from tastypie import http
 from tastypie.paginator import Paginator
 from tastypie.serializers import Serializer
 from tastypie.throttle import BaseThrottle
-from tastypie.utils import is_valid_jsonp_callback_value, dict_strip_unicode_keys, trailing_slash
+from tastypie.utils import is_valid_jsonp_callback_value, dict_strip_unicode_keys, trailing_slash, urlconf_cache_key
 from tastypie.utils.mime import determine_format, build_content_type
-from tastypie.utils import get_current_func_name, get_request_class
+from tastypie.utils import get_current_func_name, get_request_class, to_timestamp, from_timestamp
 from tastypie.validation import Validation
 from tastypie.event_handler import EventHandler
 from tastypie.bundle_pre_processor import BundlePreProcessor
@@ -76,6 +81,11 @@ except ImportError:
         return func
 
 
+# Stands in for the variable kwargs when reversing URI templates & patterns.
+URI_PLACEHOLDER = 'tastypieuri%dx'
+# Values ``reverse`` puts in a URI unchanged, & every URL pattern here accepts.
+PLAIN_URI_VALUE = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
 class NOT_AVAILABLE(object):
     def __str__(self):
@@ -115,6 +125,11 @@ class ResourceOptions(object):
     throttle = BaseThrottle()
     validation = Validation()
     paginator_class = Paginator
+    count_strategy = 'exact'
+    count_timeout = None
+    cache_responses = False
+    conditional_get = False
+    last_modified_field = None
     allowed_methods = ['get', 'post', 'put', 'delete', 'patch']
     list_allowed_methods = None
     detail_allowed_methods = None
@@ -136,9 +151,16 @@ class ResourceOptions(object):
     collection_name = 'objects'
     detail_uri_name = 'pk'
     create_on_related_fields = False
+    stream_list_responses = False
+    allow_stream_hint = False
+    stream_chunk_size = 100
+    bulk_create = False
+    bulk_create_batch_size = 500
 
     prefetch_related = []
     select_related = []
+    auto_optimize = False
+    project_columns = False
 
     def __new__(cls, meta=None):
         overrides = {}
@@ -214,6 +236,16 @@ class DeclarativeMetaclass(type):
             if hasattr(field_object, 'contribute_to_class'):
                 field_object.contribute_to_class(new_class, field_name)
 
+        # Per-class cache of compiled dehydration plans, keyed on ``for_list``
+        # & the instance's fields. See ``Resource.get_dehydration_plan``.
+        new_class._dehydration_plans = {}
+        # Per-class cache of compiled detail URI patterns, keyed on the
+        # URLconf, ``api_name`` & parent resources. See
+        # ``Resource.get_detail_uri_pattern``.
+        new_class._detail_uri_patterns = {}
+        # Per-class cache of reversed URI templates, keyed on the URLconf, URL
+        # name & fixed kwargs. See ``Resource.get_resource_uri_template``.
+        new_class._resource_uri_templates = {}
         return new_class
 
 
@@ -267,10 +299,17 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         @csrf_exempt
         def wrapper(request, *args, **kwargs):
+            # Negotiate the format once for the whole request. See
+            # ``get_request_format``.
+            request.__dict__.setdefault('_tastypie_formats', {})
 
             try:
                 callback = getattr(self, view)
                 response = callback(request, *args, **kwargs)
+
+                if self._meta.conditional_get:
+                    response = self.handle_conditional_get(request, response)
+
                 # Our response can vary based on a number of factors, use
                 # the cache class to determine what we should ``Vary`` on so
                 # caches won't return the wrong (cached) version.
@@ -424,7 +463,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
                 callback_kwargs.update({'%s_resource_name'%self._meta.resource_name: self._meta.resource_name, '%s_pk'%self._meta.resource_name: pk, 'api_name': self._meta.api_name})
                 try:
                     manager = parent_obj
-                    for att in field.attribute.split('__'):
+                    for att in field.attribute_accessor.path:
                         manager=getattr(manager,att)
                     sub_resource_obj._meta.queryset = manager.all()
                 except AttributeError: #Happens when this is ToOneSubResourceField
@@ -509,6 +548,27 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         return determine_format(request, self._meta.serializer, default_format=self._meta.default_format)
 
+    def get_request_format(self, request):
+        """
+        Returns the format to respond to ``request`` with.
+
+        Within a view wrapped by ``wrap_view``, ``determine_format`` runs once
+        per request (& serializer), keeping the result on the request.
+        Elsewhere, it runs on every call.
+        """
+        formats = request.__dict__.get('_tastypie_formats')
+
+        if formats is None:
+            return self.determine_format(request)
+
+        key = (id(self._meta.serializer), self._meta.default_format, type(self).determine_format)
+
+        try:
+            return formats[key]
+        except KeyError:
+            formats[key] = self.determine_format(request)
+            return formats[key]
+
     def serialize(self, request, data, format, options=None):
         """
         Given a request, data and a desired format, produces a serialized
@@ -716,10 +776,48 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         ``Resource._meta``.
         """
         # Authenticate the request as needed.
-        auth_result = self._meta.authentication.is_authenticated(request)
+        memo = self.get_authentication_memo(request)
+
+        if 'result' not in memo:
+            memo['result'] = self._meta.authentication.is_authenticated(request)
+
+        auth_result = memo['result']
         if not auth_result is True:
             raise ImmediateResponse(self._meta.response_router_obj[request].get_unauthorized_request_response())
 
+    def get_authentication_memo(self, request):
+        """
+        Returns the dictionary, kept on the request, that memoizes what the
+        resource's ``authentication`` has worked out about it.
+
+        Resources with equivalent backends (see
+        ``Authentication.get_request_memo_key``), like a parent & the
+        sub-resources it dispatches to, share the same dictionary, so a
+        request is only authenticated & identified once.
+        """
+        authentication = self._meta.authentication
+
+        try:
+            memo_key = authentication.get_request_memo_key()
+            hash(memo_key)
+        except (AttributeError, TypeError):
+            memo_key = id(authentication)
+
+        memos = request.__dict__.setdefault('_tastypie_authentication', {})
+        return memos.setdefault(memo_key, {})
+
+    def get_identifier(self, request):
+        """
+        Returns the ``authentication``'s identifier for the request, worked out
+        once per request.
+        """
+        memo = self.get_authentication_memo(request)
+
+        if 'identifier' not in memo:
+            memo['identifier'] = self._meta.authentication.get_identifier(request)
+
+        return memo['identifier']
+
     def throttle_check(self, request):
         """
         Handles checking if the user should be throttled.
@@ -732,7 +830,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
     def throttle_check_wsgirequest(self, request):
 
-        identifier = self._meta.authentication.get_identifier(request)
+        identifier = self.get_identifier(request)
 
         # Check to see if they should be throttled.
         if self._meta.throttle.should_be_throttled(identifier):
@@ -751,12 +849,24 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
     def log_throttled_access_wsgirequest(self, request):
         request_method = request.method.lower()
-        self._meta.throttle.accessed(self._meta.authentication.get_identifier(request), url=request.get_full_path(), request_method=request_method)
+        self._meta.throttle.accessed(self.get_identifier(request), url=request.get_full_path(), request_method=request_method)
 
     def paginate(self, bundle, object_list):
         request = bundle.request
+        paginator_kwargs = {}
+
+        # Only passed when set, so custom paginators needn't accept them.
+        if self._meta.count_strategy != 'exact':
+            paginator_kwargs['count_strategy'] = self._meta.count_strategy
+
+        # Only ``cached`` reads the key, which costs a generation lookup.
+        if self._meta.count_strategy == 'cached':
+            paginator_kwargs.update(cache=self._meta.cache, count_timeout=self._meta.count_timeout,
+                                    cache_key=self.generate_cache_key('count', _request=request))
+
         paginator = self._meta.paginator_class(request.GET, object_list, resource_uri=self.get_resource_uri(),
-                limit=self._meta.limit, max_limit=self._meta.max_limit, collection_name=self._meta.collection_name)
+                limit=self._meta.limit, max_limit=self._meta.max_limit, collection_name=self._meta.collection_name,
+                **paginator_kwargs)
         return paginator.page()
 
     def is_authorized(self, action,object_list, bundle ):
@@ -954,7 +1064,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
          #check for format
         if isinstance(bundle_or_obj,Bundle):
-            _format = self.determine_format(bundle_or_obj.request)
+            _format = self.get_request_format(bundle_or_obj.request)
         ##strip the "application" in "application/{format}"
             _format = _format.split('/')[1]
 
@@ -969,11 +1079,76 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         if bundle_or_obj is not None:
             url_name = 'api_dispatch_detail'
 
+        uri_kwargs = self.resource_uri_kwargs(bundle_or_obj)
+        template, names = self.get_resource_uri_template(url_name, uri_kwargs)
+
+        if template is not None:
+            values = {}
+
+            for name in names:
+                value = six.text_type(uri_kwargs[name])
+
+                if not PLAIN_URI_VALUE.match(value):
+                    break
+
+                values[name] = value
+            else:
+                return template % values
+
         try:
-            return self._build_reverse_url(url_name, kwargs=self.resource_uri_kwargs(bundle_or_obj))
+            return self._build_reverse_url(url_name, kwargs=uri_kwargs)
         except NoReverseMatch:
             return ''
 
+    def uses_default_urls(self):
+        """
+        Whether the resource keeps the standard URLs, so reversing & parsing
+        its URIs can skip Django's URL resolver.
+        """
+        for method_name in ('prepend_urls', 'override_urls', 'base_urls'):
+            if getattr(type(self), method_name) != getattr(Resource, method_name):
+                return False
+
+        return True
+
+    def get_resource_uri_template(self, url_name, uri_kwargs):
+        """
+        Returns a ``(template, names)`` pair to build URIs for ``url_name``
+        by string formatting rather than ``reverse``.
+
+        ``names`` are the kwargs that vary per object (the detail & parent
+        pks), which fill the ``template`` through ``%(name)s``. The template
+        is reversed once per URLconf, URL name, ``api_name`` & parent chain.
+        ``template`` is ``None`` if the URI can't be reversed, or if the
+        resource customizes its URLs.
+        """
+        names = tuple(sorted(name for name in uri_kwargs if name != 'api_name' and not name.endswith('resource_name')))
+
+        if not self.uses_default_urls():
+            return None, names
+
+        fixed_kwargs = tuple(sorted((name, value) for name, value in uri_kwargs.items() if name not in names))
+        cache_key = (urlconf_cache_key(), url_name, fixed_kwargs, names)
+
+        try:
+            return self._resource_uri_templates[cache_key], names
+        except KeyError:
+            pass
+
+        placeholder_kwargs = dict(fixed_kwargs)
+        placeholder_kwargs.update((name, URI_PLACEHOLDER % index) for index, name in enumerate(names))
+
+        try:
+            template = self._build_reverse_url(url_name, kwargs=placeholder_kwargs).replace('%', '%%')
+        except NoReverseMatch:
+            template = None
+        else:
+            for index, name in enumerate(names):
+                template = template.replace(URI_PLACEHOLDER % index, '%%(%s)s' % name)
+
+        self._resource_uri_templates[cache_key] = template
+        return template, names
+
     def get_via_uri(self, uri, request=None):
         """
         This pulls apart the salient bits of the URI and populates the
@@ -988,7 +1163,101 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         return method(uri, request)
 
 
+    def get_detail_uri_pattern(self):
+        """
+        Returns a compiled pattern matching the resource's detail URIs, with
+        the ``detail_uri_name`` value in the ``identifier`` group, or ``None``
+        if the list URI can't be reversed.
+
+        For sub-resources, the pattern also captures the parent kwargs built
+        by ``resource_parent_uri_kwargs`` (``<parent>_pk``), whatever their
+        value. Patterns are compiled once per URLconf, ``api_name`` & parent
+        chain, so matching a URI costs its length rather than a ``resolve``
+        across the whole URLconf.
+
+        Resources that customize their URLs get ``None``, since their detail
+        URIs may resolve to other kwargs.
+        """
+        if not self.uses_default_urls():
+            return None
+
+        parent_kwargs = self.resource_parent_uri_kwargs(self.parent_resource, self.parent_pk)
+        parent_pk_names = sorted(name for name in parent_kwargs if name.endswith('_pk'))
+        cache_key = (urlconf_cache_key(), self._meta.api_name, tuple(parent_pk_names))
+
+        try:
+            return self._detail_uri_patterns[cache_key]
+        except KeyError:
+            pass
+
+        if parent_pk_names:
+            # Reverse with placeholders, so any parent pk matches.
+            kwargs = self.resource_uri_kwargs()
+            kwargs.update((name, URI_PLACEHOLDER % index) for index, name in enumerate(parent_pk_names))
+
+            try:
+                list_uri = self._build_reverse_url('api_dispatch_list', kwargs=kwargs)
+            except NoReverseMatch:
+                list_uri = ''
+        else:
+            list_uri = self.get_resource_uri()
+
+        pattern = None
+
+        if list_uri:
+            regex = re.escape(list_uri.rstrip('/'))
+
+            for index, name in enumerate(parent_pk_names):
+                regex = regex.replace(re.escape(URI_PLACEHOLDER % index), r'(?P<%s>\w+)' % name)
+
+            pattern = re.compile(r"^%s/(?P<identifier>\w+)%s$" % (regex, trailing_slash()))
+
+        self._detail_uri_patterns[cache_key] = pattern
+        return pattern
+
+    def parse_detail_uri(self, uri):
+        """
+        Pulls the kwargs out of one of the resource's detail URIs, without
+        going through ``resolve``.
+
+        Returns a dictionary holding the ``detail_uri_name`` value & any
+        ``<parent>_pk`` values, or ``None`` if the URI doesn't match.
+        """
+        pattern = self.get_detail_uri_pattern()
+
+        if pattern is None:
+            return None
+
+        match = pattern.match(uri)
+
+        if match is None:
+            return None
+
+        kwargs = match.groupdict()
+        kwargs[self._meta.detail_uri_name] = kwargs.pop('identifier')
+        return kwargs
+
+    def get_via_uris(self, uris, request=None):
+        """
+        A hook to load the objects of many URIs at once. Returns a dictionary
+        of URI to object, from which missing URIs are left to ``get_via_uri``.
+
+        Returns an empty dictionary by default.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return {}
+
     def get_via_uri_wsgirequest(self, uri, request=None):
+        kwargs = self.parse_detail_uri(uri)
+
+        if kwargs is not None:
+            # Parent pks aren't lookup data, the same as with ``resolve``.
+            bundle = self.build_bundle(request=request)
+            detail_uri_name = self._meta.detail_uri_name
+            return self.obj_get(bundle=bundle, **{detail_uri_name: kwargs[detail_uri_name]})
+
         prefix = get_script_prefix()
         chomped_uri = uri
 
@@ -1010,37 +1279,71 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         return self.obj_get(bundle=bundle, **self.remove_api_resource_names(view_kwargs))
 
     # Data preparation.
-    def full_dehydrate(self, bundle, for_list=False):
+    def get_dehydration_plan(self, for_list=False):
         """
-        Given a bundle with an object instance, extract the information from it
-        to populate the resource.
+        Returns the compiled dehydration plan for the list or detail mode.
+
+        The plan is a tuple of ``(field_name, use_in, hook_name)`` entries,
+        built once per resource class, mode & set of fields (names & their
+        ``use_in``), so instances that add or remove fields on ``self.fields``
+        get a plan of their own. Fields whose static ``use_in``
+        excludes the mode are dropped up front, so ``use_in`` is only kept
+        (otherwise ``None``) when it is a callable that has to be checked per
+        bundle. ``hook_name`` names the optional ``dehydrate_<field_name>``
+        method, or is ``None`` if the resource doesn't define one.
         """
+        for_list = bool(for_list)
+        cache_key = (for_list, tuple((field_name, getattr(field_object, 'use_in', 'all')) for field_name, field_object in self.fields.items()))
+
+        try:
+            return self._dehydration_plans[cache_key]
+        except KeyError:
+            pass
+
         use_in = ['all', 'list' if for_list else 'detail']
+        plan = []
 
-        # Dehydrate each field.
         for field_name, field_object in list(self.fields.items()):
-            # If it's not for use in this mode, skip
             field_use_in = getattr(field_object, 'use_in', 'all')
+
             if callable(field_use_in):
-                if not field_use_in(bundle,for_list):
-                    continue
+                dynamic_use_in = field_use_in
+            elif field_use_in in use_in:
+                dynamic_use_in = None
             else:
-                if field_use_in not in use_in:
-                    continue
-            '''
-            # A touch leaky but it makes URI resolution work.
-            if getattr(field_object, 'dehydrated_type', None) == 'related':
-                field_object.api_name = self._meta.api_name
-                field_object.resource_name = self._meta.resource_name
-                field_object.resource_obj = self
-            '''
-            bundle.data[field_name] = field_object.dehydrate(bundle, for_list=for_list)
+                # It's not for use in this mode, skip
+                continue
 
-            # Check for an optional method to do further dehydration.
-            method = getattr(self, "dehydrate_%s" % field_name, None)
+            hook_name = "dehydrate_%s" % field_name
 
-            if method:
-                bundle.data[field_name] = method(bundle)
+            if not callable(getattr(self, hook_name, None)):
+                hook_name = None
+
+            plan.append((field_name, dynamic_use_in, hook_name))
+
+        plan = tuple(plan)
+        self._dehydration_plans[cache_key] = plan
+        return plan
+
+    def full_dehydrate(self, bundle, for_list=False):
+        """
+        Given a bundle with an object instance, extract the information from it
+        to populate the resource.
+
+        Runs the precompiled plan from ``get_dehydration_plan``.
+        """
+        fields = self.fields
+
+        # Dehydrate each field.
+        for field_name, use_in, hook_name in self.get_dehydration_plan(for_list):
+            if use_in is not None and not use_in(bundle, for_list):
+                continue
+
+            bundle.data[field_name] = fields[field_name].dehydrate(bundle, for_list=for_list)
+
+            # Run the optional method to do further dehydration.
+            if hook_name is not None:
+                bundle.data[field_name] = getattr(self, hook_name)(bundle)
 
         bundle = self.dehydrate(bundle)
         return bundle
@@ -1206,15 +1509,304 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Creates a unique-enough cache key.
 
         This is based off the current api_name/resource_name/args/kwargs.
+
+        Pass the request as ``_request`` to fetch the generations once per
+        request (see ``get_cache_generations``).
         """
+        request = kwargs.pop('_request', None)
         smooshed = []
 
         for key, value in list(kwargs.items()):
             smooshed.append("%s=%s" % (key, value))
 
+        generations = self.get_cache_generations(self.get_cache_namespaces(**kwargs), request)
+
+        if any(generation is not None for generation in generations):
+            # Versioned, so ``invalidate_cache`` can orphan the key.
+            args = ('g%s' % '.'.join(str(generation) for generation in generations),) + args
+
         # Use a list plus a ``.join()`` because it's faster than concatenation.
         return "%s:%s:%s:%s" % (self._meta.api_name, self._meta.resource_name, ':'.join(args), ':'.join(sorted(smooshed)))
 
+    def get_cache_namespaces(self, **kwargs):
+        """
+        Returns the namespaces whose generations go into a cache key built
+        from ``kwargs``.
+
+        Every key carries the resource's own namespace. Keys that identify a
+        single object (by ``Meta.detail_uri_name``) also carry that object's
+        namespace; all others carry the resource's ``list`` namespace.
+        """
+        namespace = "%s:%s" % (self._meta.api_name, self._meta.resource_name)
+        detail_uri_name = self._meta.detail_uri_name
+
+        if detail_uri_name in kwargs:
+            return [namespace, "%s:%s=%s" % (namespace, detail_uri_name, kwargs[detail_uri_name])]
+
+        return [namespace, "%s:list" % namespace]
+
+    def get_cache_generations(self, namespaces, request=None):
+        """
+        Returns the current generation of each of the ``namespaces`` from the
+        resource's ``cache``.
+
+        Given a ``request``, generations are only fetched once per request &
+        kept on it, so building several keys costs a single round trip.
+        """
+        if request is None:
+            return self._meta.cache.get_generations(namespaces)
+
+        known = request.__dict__.setdefault('_tastypie_cache_generations', {})
+        cache_id = id(self._meta.cache)
+        missing = [namespace for namespace in namespaces if (cache_id, namespace) not in known]
+
+        if missing:
+            known.update(((cache_id, namespace), generation) for namespace, generation in zip(missing, self._meta.cache.get_generations(missing)))
+
+        return [known[(cache_id, namespace)] for namespace in namespaces]
+
+    def invalidate_cache(self, obj=None, request=None):
+        """
+        Orphans cached data, responses included, by bumping generations in
+        the resource's ``cache``.
+
+        Given an ``obj``, only that object's keys & the list keys go, so other
+        cached objects survive. Without one, everything cached for the
+        resource goes. Either way, it costs an ``incr`` or two & no key scan.
+
+        The bump is repeated once the transaction commits, so data cached
+        mid-transaction doesn't outlive it. Given a ``request``, the
+        generations it has already fetched are dropped too.
+        """
+        base = self.get_cache_namespaces()[0]
+
+        if obj is None:
+            namespaces = [base]
+        else:
+            detail_uri_name = self._meta.detail_uri_name
+            namespaces = self.get_cache_namespaces(**{detail_uri_name: getattr(obj, detail_uri_name)})[1:]
+            namespaces += self.get_cache_namespaces()[1:]
+
+        def bump():
+            for namespace in namespaces:
+                self._meta.cache.bump_generation(namespace)
+
+            if request is not None:
+                known = request.__dict__.get('_tastypie_cache_generations', {})
+
+                for namespace in namespaces:
+                    known.pop((id(self._meta.cache), namespace), None)
+
+        bump()
+        transaction.on_commit(bump)
+
+    def get_list_version(self, bundle, object_list):
+        """
+        A hook to supply a cheap version of the (filtered) ``object_list``,
+        as a ``(token, last_modified)`` pair, so ``Meta.conditional_get`` can
+        answer with a 304 before anything is dehydrated.
+
+        Returns ``None`` by default, which leaves ETags to a hash of the
+        response body.
+
+        ``ModelResource`` includes a version based on
+        ``Meta.last_modified_field``.
+        """
+        return None
+
+    def get_detail_version(self, bundle, obj):
+        """
+        Like ``get_list_version``, for a single object.
+        """
+        return None
+
+    def get_version_validators(self, request, version, **kwargs):
+        """
+        Turns a ``(token, last_modified)`` version into an ``(etag,
+        last_modified)`` pair of validators for the request.
+
+        The ETag is weak, as it follows the data rather than the bytes, & also
+        covers the GET parameters, the negotiated format & the authorization's
+        cache scope.
+        """
+        if version is None:
+            return None, None
+
+        token, last_modified = version
+
+        if hasattr(request.GET, 'lists'):
+            params = sorted(request.GET.lists())
+        else:
+            params = sorted(request.GET.items())
+
+        scope = self._meta.authorization.get_cache_scope(self.build_bundle(request=request))
+        digest = hashlib.md5(repr((token, self.get_request_format(request), scope, params, sorted(kwargs.items()))).encode('utf-8')).hexdigest()
+        return 'W/"%s"' % digest, last_modified
+
+    def is_not_modified(self, request, etag=None, last_modified=None):
+        """
+        Checks the request's ``If-None-Match`` (or, failing that,
+        ``If-Modified-Since``) header against the given validators.
+        """
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+
+        if if_none_match:
+            if etag is None:
+                return False
+
+            if if_none_match.strip() == '*':
+                return True
+
+            # Weak comparison, as for ``GET``.
+            opaque = lambda tag: tag[2:] if tag.startswith('W/') else tag
+            return opaque(etag) in [opaque(tag) for tag in parse_etags(if_none_match)]
+
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+
+        if if_modified_since is None or last_modified is None:
+            return False
+
+        return int(to_timestamp(last_modified)) <= if_modified_since
+
+    def not_modified_response(self, request, etag=None, last_modified=None):
+        """
+        Returns a 304 carrying the validators, or ``None`` if the client's
+        copy is stale.
+        """
+        if not self.is_not_modified(request, etag, last_modified):
+            return None
+
+        return self.set_validators(self._meta.response_router_obj[request].get_not_modified_response(), etag, last_modified)
+
+    def set_validators(self, response, etag=None, last_modified=None):
+        if etag is not None:
+            response['ETag'] = etag
+
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(to_timestamp(last_modified))
+
+        return response
+
+    def get_response_validators(self, response):
+        """
+        Reads the ``(etag, last_modified)`` validators back off a response.
+        """
+        last_modified = None
+
+        if response.has_header('Last-Modified'):
+            timestamp = parse_http_date_safe(response['Last-Modified'])
+
+            if timestamp is not None:
+                last_modified = from_timestamp(timestamp)
+
+        return response.get('ETag'), last_modified
+
+    def handle_conditional_get(self, request, response):
+        """
+        Gives successful ``GET`` responses without an ETag one made from a
+        hash of the body, then answers with a 304 if the client's copy
+        matches.
+        """
+        if request.method != 'GET' or response.status_code != 200 or response.streaming:
+            return response
+
+        if not response.has_header('ETag'):
+            response['ETag'] = '"%s"' % hashlib.md5(response.content).hexdigest()
+
+        etag, last_modified = self.get_response_validators(response)
+        not_modified = self.not_modified_response(request, etag, last_modified)
+
+        if not_modified is None:
+            return response
+
+        if last_modified is not None:
+            not_modified['Last-Modified'] = response['Last-Modified']
+
+        return not_modified
+
+    def get_response_cache_key(self, request, view_type, **kwargs):
+        """
+        Returns the key a ``GET`` response is cached under when
+        ``Meta.cache_responses`` is on, or ``None`` otherwise.
+
+        The key covers the GET parameters, the negotiated format & the
+        authorization's ``get_cache_scope``. It carries the same generations
+        as the other keys (see ``invalidate_cache``), so writes orphan it.
+        Responses aren't cached if the ``cache`` has no generations, as they
+        couldn't be invalidated.
+        """
+        if not self._meta.cache_responses:
+            return None
+
+        detail_uri_name = self._meta.detail_uri_name
+        namespace_kwargs = {}
+
+        if detail_uri_name in kwargs:
+            namespace_kwargs[detail_uri_name] = kwargs[detail_uri_name]
+
+        generations = self.get_cache_generations(self.get_cache_namespaces(**namespace_kwargs), request)
+
+        if all(generation is None for generation in generations):
+            return None
+
+        if hasattr(request.GET, 'lists'):
+            params = sorted(request.GET.lists())
+        else:
+            params = sorted(request.GET.items())
+
+        scope = self._meta.authorization.get_cache_scope(self.build_bundle(request=request))
+        digest = hashlib.md5(repr((self.get_request_format(request), scope, params, sorted(kwargs.items()))).encode('utf-8')).hexdigest()
+        return self.generate_cache_key('response', view_type, digest, _request=request, **namespace_kwargs)
+
+    def invalidate_response_cache(self, request=None):
+        """
+        Orphans every cached response of this resource, along with everything
+        else cached for it. See ``invalidate_cache``, which the ``obj_*``
+        write methods call.
+        """
+        self.invalidate_cache(request=request)
+
+    def get_cached_response(self, request, cache_key):
+        """
+        Rebuilds a response from the cache, or returns ``None`` on a miss.
+        """
+        if cache_key is None:
+            return None
+
+        cached = self._meta.cache.get(cache_key)
+
+        if cached is None:
+            return None
+
+        content, content_type, validators = cached
+        response_class = self._meta.response_router_obj[request].get_default_response_class()
+        response = response_class(content=content, content_type=content_type)
+
+        # The same validators as on a miss, so ``If-None-Match`` keeps matching.
+        for header, value in validators:
+            response[header] = value
+
+        if self._meta.conditional_get:
+            etag, last_modified = self.get_response_validators(response)
+            not_modified = self.not_modified_response(request, etag, last_modified)
+
+            if not_modified is not None:
+                return not_modified
+
+        return response
+
+    def cache_response(self, cache_key, response):
+        """
+        Stores the body of a successful, non-streaming response in the cache,
+        along with its ``ETag`` & ``Last-Modified`` validators. Returns the
+        response.
+        """
+        if cache_key is not None and response.status_code == 200 and not response.streaming:
+            validators = [(header, response[header]) for header in ('ETag', 'Last-Modified') if response.has_header(header)]
+            self._meta.cache.set(cache_key, (response.content, response['Content-Type'], validators))
+
+        return response
+
     # Data access methods.
 
     def get_object_list(self, request):
@@ -1286,7 +1878,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         A version of ``obj_get_list`` that uses the cache as a means to get
         commonly-accessed data faster.
         """
-        cache_key = self.generate_cache_key('list', **kwargs)
+        cache_key = self.generate_cache_key('list', _request=bundle.request, **kwargs)
         obj_list = self._meta.cache.get(cache_key)
 
         if obj_list is None:
@@ -1295,6 +1887,19 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         return obj_list
 
+    def prefetch_to_many(self, bundle, objects, for_list=False):
+        """
+        A hook to fetch the to-many related data of a whole page of objects
+        up front, instead of once per object during ``full_dehydrate``.
+
+        Must return the objects to dehydrate. Returns them untouched by
+        default.
+
+        ``ModelResource`` includes a full working version specific to Django's
+        ``Models``.
+        """
+        return objects
+
     def obj_get(self, bundle, **kwargs):
         """
         Fetches an individual object on the resource.
@@ -1314,7 +1919,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         optimize_query = kwargs.pop('_optimize_query',False)
 
-        cache_key = self.generate_cache_key('detail', **kwargs)
+        cache_key = self.generate_cache_key('detail', _request=bundle.request, **kwargs)
         cached_bundle = self._meta.cache.get(cache_key)
 
         if cached_bundle is None:
@@ -1334,6 +1939,22 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         """
         raise NotImplementedError()
 
+    def obj_create_list(self, bundles, **kwargs):
+        """
+        Creates new objects based on the provided bundles, as ``patch_list``
+        does for the new items in its collection.
+
+        Calls ``obj_create`` for each bundle by default & returns the
+        bundles passed in.
+
+        ``ModelResource`` includes a version that can insert them in bulk
+        (see ``Meta.bulk_create``).
+        """
+        for bundle in bundles:
+            self.obj_create(bundle, **kwargs)
+
+        return bundles
+
     def obj_update(self, bundle, **kwargs):
         """
         Updates an existing object (or creates a new object) based on the
@@ -1386,12 +2007,79 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         Mostly a useful shortcut/hook.
         """
         response_class = response_class or  self._meta.response_router_obj[request].get_default_response_class()
-        desired_format = self.determine_format(request)
+        desired_format = self.get_request_format(request)
         serialized = self.serialize(request, data, desired_format)
         return response_class(content=serialized,
                               content_type=build_content_type(desired_format), **response_kwargs)
 
 
+    def should_stream_list(self, request):
+        """
+        Decides if ``get_list`` streams its response, either because
+        ``Meta.stream_list_responses`` is set or the request asks for it with
+        ``?stream=1`` & ``Meta.allow_stream_hint`` is set. Only plain JSON can
+        be streamed.
+
+        Resources that override ``alter_list_data_to_serialize`` are never
+        streamed, as streaming skips it.
+        """
+        if not self._meta.stream_list_responses:
+            if not self._meta.allow_stream_hint or request.GET.get('stream') not in ('1', 'true'):
+                return False
+
+        if type(self).alter_list_data_to_serialize != Resource.alter_list_data_to_serialize:
+            return False
+
+        return self.get_request_format(request) == 'application/json'
+
+    def create_streaming_list_response(self, request, base_bundle, data, **response_kwargs):
+        """
+        Streams a page of list data as JSON. The ``meta`` block is written
+        first, then each object is dehydrated & encoded in turn.
+
+        ``alter_list_data_to_serialize`` is not called, as the dehydrated
+        objects are never held together.
+        """
+        objects = data.pop(self._meta.collection_name)
+        desired_format = self.get_request_format(request)
+        response_class = self._meta.response_router_obj[request].get_streaming_response_class()
+        stream = self._meta.serializer.to_json_stream(data, self._meta.collection_name,
+                                                      self.iter_list_bundles(base_bundle, objects))
+        return response_class(stream, content_type=build_content_type(desired_format), **response_kwargs)
+
+    def iter_list_bundles(self, base_bundle, objects):
+        """
+        Yields a list-mode dehydrated bundle for each object, firing
+        ``list_read`` once all of them have been read.
+        """
+        read_objects = []
+
+        for chunk in self.iter_list_chunks(base_bundle, objects):
+            for obj in chunk:
+                bundle = self.build_bundle(obj=obj, request=base_bundle.request)
+                read_objects.append(obj)
+                yield self.full_dehydrate(bundle, for_list=True)
+
+        self.fire_event('list_read', args=(read_objects, base_bundle))
+
+    def iter_list_chunks(self, bundle, objects, chunk_size=None):
+        """
+        Yields ``objects`` in lists of up to ``chunk_size`` (defaulting to
+        ``Meta.stream_chunk_size``), each passed through ``prefetch_to_many``.
+        """
+        chunk_size = chunk_size or self._meta.stream_chunk_size
+        chunk = []
+
+        for obj in objects:
+            chunk.append(obj)
+
+            if len(chunk) >= chunk_size:
+                yield self.prefetch_to_many(bundle, chunk, for_list=True)
+                chunk = []
+
+        if chunk:
+            yield self.prefetch_to_many(bundle, chunk, for_list=True)
+
     def error_response(self, request, errors, response_class=None):
         """
         Extracts the common "which-format/serialize/return-error-response"
@@ -1407,7 +2095,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         if request:
             if request.GET.get('callback', None) is None:
                 try:
-                    desired_format = self.determine_format(request)
+                    desired_format = self.get_request_format(request)
                 except BadRequest:
                     pass  # Fall through to default handler below
             else:
@@ -1532,8 +2220,13 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         Should return a HttpResponse (200 OK).
         """
-        # TODO: Uncached for now. Invalidation that works for everyone may be
-        #       impossible.
+        # Whole responses are cached only with ``Meta.cache_responses``.
+        response_cache_key = self.get_response_cache_key(request, 'list', **kwargs)
+        response = self.get_cached_response(request, response_cache_key)
+
+        if response is not None:
+            return response
+
         base_bundle = self.build_bundle(request=request)
         objects = self.obj_get_list(bundle=base_bundle, **self.remove_api_resource_names(kwargs))
 
@@ -1543,13 +2236,28 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             data = {"error": e.message}
             return self.error_response(request, data, response_class=self._meta.response_router_obj[request].get_bad_request_response_class())
 
+        etag = last_modified = None
+
+        if self._meta.conditional_get:
+            version = self.get_list_version(base_bundle, sorted_objects)
+            etag, last_modified = self.get_version_validators(request, version, **kwargs)
+            response = self.not_modified_response(request, etag, last_modified)
+
+            if response is not None:
+                return response
+
         to_be_serialized = self.paginate(base_bundle, sorted_objects)
 
         base_bundle = self.preprocess('read_list', base_bundle)
 
+        if self.should_stream_list(request):
+            return self.create_streaming_list_response(request, base_bundle, to_be_serialized)
+
+        objects = self.prefetch_to_many(base_bundle, to_be_serialized[self._meta.collection_name], for_list=True)
+
         # Dehydrate the bundles in preparation for serialization.
         bundles = []
-        for obj in to_be_serialized[self._meta.collection_name]:
+        for obj in objects:
             bundle = self.build_bundle(obj=obj, request=request)
             bundles.append(self.full_dehydrate(bundle, for_list=True))
 
@@ -1558,7 +2266,8 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
         self.fire_event('list_read', args=([bundle.obj for obj in \
                 to_be_serialized[self._meta.collection_name]], base_bundle))
 
-        return self.create_response(request, to_be_serialized)
+        response = self.set_validators(self.create_response(request, to_be_serialized), etag, last_modified)
+        return self.cache_response(response_cache_key, response)
 
     def get_detail(self, request, **kwargs):
         """
@@ -1569,6 +2278,12 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
 
         Should return a HttpResponse (200 OK).
         """
+        response_cache_key = self.get_response_cache_key(request, 'detail', **kwargs)
+        response = self.get_cached_response(request, response_cache_key)
+
+        if response is not None:
+            return response
+
         basic_bundle = self.build_bundle(request=request)
 
         try:
@@ -1579,11 +2294,22 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
             return  self._meta.response_router_obj[request].get_multiple_choices_response("More than one resource is found at this URI.")
 
         bundle = self.build_bundle(obj=obj, request=request)
+        etag = last_modified = None
+
+        if self._meta.conditional_get:
+            version = self.get_detail_version(bundle, obj)
+            etag, last_modified = self.get_version_validators(request, version, **kwargs)
+            response = self.not_modified_response(request, etag, last_modified)
+
+            if response is not None:
+                return response
+
         bundle = self.preprocess('read_detail', bundle)
         bundle = self.full_dehydrate(bundle)
         bundle = self.alter_detail_data_to_serialize(request, bundle)
         self.fire_event('detail_read', args=(self.get_object_list(bundle.request), bundle))
-        return self.create_response(request, bundle)
+        response = self.set_validators(self.create_response(request, bundle), etag, last_modified)
+        return self.cache_response(response_cache_key, response)
 
     def post_list(self, request, **kwargs):
         """
@@ -1861,9 +2587,7 @@ class Resource(six.with_metaclass(DeclarativeMetaclass)):
                 bundle = self.build_bundle(data=dict_strip_unicode_keys(data), request=request)
                 to_be_created.append(bundle)
 
-        for cr_bun in to_be_created:
-            self.obj_create(bundle=cr_bun)
-            bundles_seen.append(cr_bun)
+        bundles_seen.extend(self.obj_create_list(to_be_created))
 
         for up_agrs in to_be_updated:
             self.update_in_place(*up_agrs)
@@ -2030,6 +2754,8 @@ class ModelDeclarativeMetaclass(DeclarativeMetaclass):
 
         # Add in the new fields.
         new_class.base_fields.update(new_class.get_fields(include_fields, excludes))
+        new_class._auto_optimizer_params = {}
+        new_class._projected_columns = {}
 
         if getattr(new_class._meta, 'include_absolute_url', True):
             if not 'absolute_url' in new_class.base_fields:
@@ -2396,35 +3122,19 @@ class BaseModelResource(Resource):
     def get_query_optimizer_params(self, bundle, for_list=False): #passing request to maintain consistency with get_object_list
         prefetch_related_set = set([])
         select_related_set = set([])
-        use_in = ['all', 'list' if for_list else 'detail']
 
-        def field_attr_to_related_attr_converter(attr):
-            curr = ''
-            for fragment in attr.split('__'):
-                if curr:
-                    curr = curr + "__" + fragment
-                else:
-                    curr = fragment
-                yield curr
-
-
-        for field_name, field_object in list(self.fields.items()):
+        for field_name, use_in, hook_name in self.get_dehydration_plan(for_list):
             # If it's not for use in this mode, skip
-            field_use_in = getattr(field_object, 'use_in', 'all')
-            if callable(field_use_in):
-                if not field_use_in(bundle, for_list):
-                    continue
-            else:
-                if field_use_in not in use_in:
-                    continue
+            if use_in is not None and not use_in(bundle, for_list):
+                continue
+
+            field_object = self.fields[field_name]
 
             if field_object.instance_name in self._meta.prefetch_related + self._meta.select_related:
                 if field_object.instance_name in self._meta.prefetch_related:
-                    for attr in field_attr_to_related_attr_converter(field_object.attribute):
-                        prefetch_related_set.add(attr)
+                    prefetch_related_set.update(field_object.attribute_accessor.lookups)
                 else:
-                    for attr in field_attr_to_related_attr_converter(field_object.attribute):
-                        select_related_set.add(attr)
+                    select_related_set.update(field_object.attribute_accessor.lookups)
 
                 if getattr(field_object, 'is_related', False) and getattr(field_object,
                                                                           'full', False):
@@ -2433,17 +3143,324 @@ class BaseModelResource(Resource):
                     sr_prefetch_related_set = ['%s__%s' %(field_object.attribute,prefetch) for prefetch in sr_prefetch_related_set]
                     sr_select_related_set = ['%s__%s' %(field_object.attribute,select_related) for select_related in sr_select_related_set]
                     prefetch_related_set.update(sr_prefetch_related_set)
-                    prefetch_related_set.update(sr_select_related_set)
 
+                    # Nested joins can only ride along a parent that is joined too.
+                    if field_object.instance_name in self._meta.select_related:
+                        select_related_set.update(sr_select_related_set)
+                    else:
+                        prefetch_related_set.update(sr_select_related_set)
+
+        if self._meta.auto_optimize:
+            auto_prefetch_related_set, auto_select_related_set = self.get_auto_optimizer_params(for_list=for_list)
+            prefetch_related_set.update(auto_prefetch_related_set)
+            select_related_set.update(auto_select_related_set)
 
         return prefetch_related_set, select_related_set
 
+    def get_auto_optimizer_params(self, for_list=False):
+        """
+        Infers ``(prefetch_related_set, select_related_set)`` from the
+        resource's field graph. Used when ``Meta.auto_optimize = True``.
+
+        Every related field dehydrated in this mode is followed through the
+        model's ``_meta``, including ``__`` chains & nested resources that are
+        fully dehydrated in this mode (``full_list`` for lists, ``full_detail``
+        for details). Fields with a callable ``use_in`` are left out, as it
+        can't be known here whether they're dehydrated; list them in
+        ``Meta.prefetch_related`` if they need it. Lookups made only of forward (or reverse one-to-one)
+        relations are joined with ``select_related``; anything crossing a
+        reverse FK, M2M or generic relation goes to ``prefetch_related``.
+
+        The result is computed once per resource class & mode.
+        """
+        for_list = bool(for_list)
+
+        try:
+            return self._auto_optimizer_params[for_list]
+        except KeyError:
+            pass
+
+        prefetch_related_set = set()
+        select_related_set = set()
+        self._collect_related_lookups(self._meta.object_class, '', True, for_list,
+                                      prefetch_related_set, select_related_set,
+                                      (self.__class__,), not for_list)
+        params = (frozenset(prefetch_related_set), frozenset(select_related_set))
+        self._auto_optimizer_params[for_list] = params
+        return params
+
+    def _collect_related_lookups(self, model, prefix, joinable, for_list,
+                                 prefetch_related_set, select_related_set, seen, detail_request):
+        for field_name, use_in, hook_name in self.get_dehydration_plan(for_list):
+            field_object = self.fields[field_name]
+
+            if not getattr(field_object, 'is_related', False):
+                continue
+
+            # Only known per bundle.
+            if use_in is not None:
+                continue
+
+            if not isinstance(field_object.attribute, six.string_types):
+                continue
+
+            # Sub-resources filter through the related resource's authorization.
+            if getattr(field_object, 'is_m2m', False) and isinstance(field_object, fields.BaseSubResourceField):
+                continue
+
+            current_model = model
+            lookup = prefix
+            path_joinable = joinable
+
+            for attr in field_object.attribute_accessor.path:
+                try:
+                    django_field = current_model._meta.get_field(attr)
+                except (FieldDoesNotExist, AttributeError):
+                    current_model = None
+                    break
+
+                if not django_field.is_relation:
+                    current_model = None
+                    break
+
+                lookup = LOOKUP_SEP.join([lookup, attr]) if lookup else attr
+                current_model = django_field.related_model
+
+                if django_field.many_to_many or django_field.one_to_many or current_model is None:
+                    path_joinable = False
+
+                if path_joinable:
+                    select_related_set.add(lookup)
+                else:
+                    prefetch_related_set.add(lookup)
+
+                if current_model is None:
+                    break
+
+            if current_model is None or not getattr(field_object, 'full', False):
+                continue
+
+            # As ``should_full_dehydrate`` decides, by the request's type.
+            if detail_request:
+                full = field_object.full_detail
+            else:
+                full = field_object.full_list
+
+            if not callable(full) and not full:
+                continue
+
+            to_class = field_object.to_class
+
+            if not isinstance(to_class, type) or to_class in seen:
+                continue
+
+            related_resource = to_class()
+
+            if not hasattr(related_resource, '_collect_related_lookups'):
+                continue
+
+            # Nested resources are always dehydrated in detail mode, though
+            # ``full_*`` still follows the request.
+            related_resource._collect_related_lookups(current_model, lookup, path_joinable, False,
+                                                      prefetch_related_set, select_related_set,
+                                                      seen + (to_class,), detail_request)
+
+    def get_to_many_prefetch_lookups(self, bundle, for_list=False):
+        """
+        Returns the ``prefetch_related`` lookups for the to-many fields being
+        dehydrated in this mode.
+
+        Only fields whose ``attribute`` resolves to a reverse FK or M2M on the
+        model are included. Sub-resource fields are left out, as they filter
+        their related objects through the related resource's authorization.
+        """
+        lookups = []
+
+        for field_name, use_in, hook_name in self.get_dehydration_plan(for_list):
+            if use_in is not None and not use_in(bundle, for_list):
+                continue
+
+            field_object = self.fields[field_name]
+
+            if not getattr(field_object, 'is_m2m', False):
+                continue
+
+            if isinstance(field_object, fields.BaseSubResourceField):
+                continue
+
+            if not isinstance(field_object.attribute, six.string_types):
+                continue
+
+            model = self._meta.object_class
+            django_field = None
+
+            for attr in field_object.attribute_accessor.path:
+                try:
+                    django_field = model._meta.get_field(attr)
+                except (FieldDoesNotExist, AttributeError):
+                    django_field = None
+                    break
+
+                model = getattr(django_field, 'related_model', None)
+
+                if model is None:
+                    django_field = None
+                    break
+
+            if django_field is not None and (django_field.many_to_many or django_field.one_to_many):
+                lookups.append(field_object.attribute)
+
+        return lookups
+
+    def prefetch_to_many(self, bundle, objects, for_list=False):
+        """
+        An ORM-specific implementation of ``prefetch_to_many``.
+
+        Fetches every to-many relation dehydrated in this mode for the whole
+        page in one query per field (grouped by parent through Django's
+        ``prefetch_related_objects``), so ``ToManyField.dehydrate`` reads from
+        the prefetch cache instead of querying once per object.
+        """
+        objects = list(objects)
+
+        if not objects:
+            return objects
+
+        lookups = self.get_to_many_prefetch_lookups(bundle, for_list=for_list)
+
+        if lookups:
+            prefetch_related_objects(objects, *lookups)
+
+        return objects
+
+    def get_list_version(self, bundle, object_list):
+        """
+        An ORM-specific implementation of ``get_list_version``.
+
+        With ``Meta.last_modified_field`` set, the version is the latest value
+        of that field plus the number of objects, found in one aggregate
+        query. The count catches deletions, which don't move the latest value.
+        As only the ETag covers the count, lists get no ``Last-Modified``, so
+        ``If-Modified-Since`` alone can't hide a deletion.
+        """
+        field_name = self._meta.last_modified_field
+
+        if field_name is None or not hasattr(object_list, 'aggregate'):
+            return None
+
+        aggregates = object_list.order_by().aggregate(last_modified=Max(field_name), count=Count('pk'))
+        last_modified = aggregates['last_modified']
+        token = '%s:%s' % (last_modified.isoformat() if last_modified else '', aggregates['count'])
+        return token, None
+
+    def get_detail_version(self, bundle, obj):
+        """
+        An ORM-specific implementation of ``get_detail_version``, using the
+        object's ``Meta.last_modified_field``.
+        """
+        field_name = self._meta.last_modified_field
+
+        if field_name is None:
+            return None
+
+        last_modified = getattr(obj, field_name)
+
+        if last_modified is None:
+            return None
+
+        return '%s:%s' % (obj.pk, last_modified.isoformat()), last_modified
+
+    def get_projected_columns(self, for_list=False):
+        """
+        Returns the model fields a list query needs to load in this mode, for
+        use with ``.only()`` when ``Meta.project_columns = True``.
+
+        Covers the primary key, the ``detail_uri_name`` & the local column
+        behind every dehydrated field's ``attribute`` (the FK column for
+        ``__`` chains). Returns ``None`` if any field reads something other
+        than a model field (a property, method or generic relation), as the
+        columns it needs can't be known. Values read only from custom
+        ``dehydrate`` hooks must be exposed as fields too.
+
+        The result is computed once per resource class & mode.
+        """
+        for_list = bool(for_list)
+
+        try:
+            return self._projected_columns[for_list]
+        except KeyError:
+            pass
+
+        opts = self._meta.object_class._meta
+        columns = [opts.pk.name]
+
+        try:
+            columns.append(opts.get_field(self._meta.detail_uri_name).name)
+        except FieldDoesNotExist:
+            pass
+
+        for field_name, use_in, hook_name in self.get_dehydration_plan(for_list):
+            field_object = self.fields[field_name]
+
+            if field_object.attribute is None:
+                continue
+
+            if not isinstance(field_object.attribute, six.string_types):
+                columns = None
+                break
+
+            try:
+                django_field = opts.get_field(field_object.attribute_accessor.path[0])
+            except FieldDoesNotExist:
+                columns = None
+                break
+
+            if django_field.concrete and not django_field.many_to_many:
+                columns.append(django_field.name)
+            elif django_field.many_to_one:
+                # Generic foreign keys span columns we can't name reliably.
+                columns = None
+                break
+
+        if columns is not None:
+            columns = tuple(sorted(set(columns)))
+
+        self._projected_columns[for_list] = columns
+        return columns
+
+    def iter_list_chunks(self, bundle, objects, chunk_size=None):
+        """
+        An ORM-specific implementation of ``iter_list_chunks``.
+
+        Querysets are read with ``.iterator()`` so rows aren't all held in
+        its result cache. As the iterator skips ``prefetch_related``, those
+        lookups are applied to each chunk instead.
+        """
+        chunk_size = chunk_size or self._meta.stream_chunk_size
+        lookups = ()
+
+        if isinstance(objects, QuerySet):
+            lookups = objects._prefetch_related_lookups
+            objects = objects.iterator(chunk_size=chunk_size)
+
+        for chunk in super(BaseModelResource, self).iter_list_chunks(bundle, objects, chunk_size=chunk_size):
+            if lookups:
+                prefetch_related_objects(chunk, *lookups)
+
+            yield chunk
+
     def optimize_query(self, qs, bundle, for_list=False):
         prefetch_related_set, select_related_set = self.get_query_optimizer_params(bundle, for_list=for_list)
         if len(prefetch_related_set) > 0:
             qs = qs.prefetch_related(*prefetch_related_set)
         if len(select_related_set) > 0:
             qs = qs.select_related(*select_related_set)
+        if for_list and self._meta.project_columns:
+            columns = self.get_projected_columns(for_list=for_list)
+            if columns:
+                # Joined relations can't be deferred.
+                columns = set(columns).union(lookup.split(LOOKUP_SEP)[0] for lookup in select_related_set)
+                qs = qs.only(*columns)
         return qs
 
     def get_object_list(self, request):
@@ -2505,6 +3522,72 @@ class BaseModelResource(Resource):
         except ValueError:
             raise NotFound("Invalid resource lookup data provided (mismatched type).")
 
+    def get_via_uris(self, uris, request=None):
+        """
+        A ORM-specific implementation of ``get_via_uris``.
+
+        Parses the URIs with ``get_detail_uri_pattern`` & loads the objects
+        with a single ``__in`` query. As in ``obj_get``, each object is then
+        checked with the authorization's ``read_detail``. Sub-resources &
+        resources that customize ``get_via_uri`` or ``obj_get`` keep going
+        through those, as do identifiers matching several objects.
+        """
+        if self.parent_obj is not None:
+            return {}
+
+        for method_name in ('get_via_uri', 'get_via_uri_wsgirequest', 'obj_get'):
+            if getattr(type(self), method_name) != getattr(BaseModelResource, method_name):
+                return {}
+
+        pattern = self.get_detail_uri_pattern()
+
+        if pattern is None:
+            return {}
+
+        detail_uri_name = self._meta.detail_uri_name
+        identifiers = {}
+
+        for uri in uris:
+            match = pattern.match(uri)
+
+            if match is None:
+                continue
+
+            identifier = match.group('identifier')
+
+            if detail_uri_name == 'pk' and not identifier.isdigit():
+                # Leave the error to ``obj_get``.
+                continue
+
+            identifiers[uri] = identifier
+
+        if not identifiers:
+            return {}
+
+        object_list = self.get_object_list(request).filter(**{'%s__in' % detail_uri_name: set(identifiers.values())})
+        by_identifier = {}
+        duplicates = set()
+
+        try:
+            for obj in object_list:
+                identifier = six.text_type(getattr(obj, detail_uri_name))
+
+                if identifier in by_identifier:
+                    # Leave the ``MultipleObjectsReturned`` to ``obj_get``.
+                    duplicates.add(identifier)
+
+                by_identifier[identifier] = obj
+        except (ValueError, ValidationError):
+            return {}
+
+        for identifier in duplicates:
+            del by_identifier[identifier]
+
+        for obj in by_identifier.values():
+            self.is_authorized("read_detail", object_list, self.build_bundle(obj=obj, request=request))
+
+        return dict((uri, by_identifier[identifier]) for uri, identifier in identifiers.items() if identifier in by_identifier)
+
     def obj_create(self, bundle, **kwargs):
         """
         A ORM-specific implementation of ``obj_create``.
@@ -2521,9 +3604,111 @@ class BaseModelResource(Resource):
 
         bundle = self.full_hydrate(bundle)
         bundle = self.save(bundle)
+        self.invalidate_cache(bundle.obj, request=bundle.request)
         self.fire_event('detail_created', args=(self.get_object_list(bundle.request), bundle))
         return bundle
 
+    def can_bulk_create(self, bundles):
+        """
+        Returns whether the bundles can be inserted with ``bulk_create``.
+
+        Requires ``Meta.bulk_create``, more than one bundle, a database that
+        returns the new primary keys & a model without parents. Bundles with
+        data for writable to-many fields, or nested data for to-one fields,
+        need the related saves of ``obj_create`` & rule it out.
+        """
+        if not self._meta.bulk_create or len(bundles) < 2:
+            return False
+
+        model = self._meta.object_class
+
+        if model is None or model._meta.parents:
+            return False
+
+        features = connections[router.db_for_write(model)].features
+
+        if not getattr(features, 'can_return_rows_from_bulk_insert', getattr(features, 'can_return_ids_from_bulk_insert', False)):
+            return False
+
+        for field_name, field_object in self.fields.items():
+            if not getattr(field_object, 'is_related', False) or field_object.readonly:
+                continue
+
+            for bundle in bundles:
+                value = bundle.data.get(field_name)
+
+                if getattr(field_object, 'is_m2m', False):
+                    if value:
+                        return False
+                elif hasattr(value, 'keys'):
+                    return False
+
+        return True
+
+    def obj_create_list(self, bundles, **kwargs):
+        """
+        A ORM-specific implementation of ``obj_create_list``.
+
+        When ``can_bulk_create`` allows it, every bundle is hydrated &
+        validated first, then authorized. The lot goes through a single
+        ``create_list`` check if the authorization sets
+        ``create_list_accepts_objects`` (its ``object_list`` is then a plain
+        list of the new objects), or ``create_detail`` per bundle otherwise.
+        They're then inserted with ``bulk_create`` in batches of
+        ``Meta.bulk_create_batch_size``. ``detail_created`` fires for each
+        bundle afterwards. Otherwise, falls back to ``obj_create`` per bundle.
+
+        ``Model.save`` & its signals are skipped in bulk.
+        """
+        if not self.can_bulk_create(bundles):
+            return super(BaseModelResource, self).obj_create_list(bundles, **kwargs)
+
+        for bundle in bundles:
+            bundle.obj = self._meta.object_class()
+
+            for key, value in list(kwargs.items()):
+                setattr(bundle.obj, key, value)
+
+            self.preprocess('create_detail', bundle)
+            self.validate_to_one_subresource(bundle)
+            self.full_hydrate(bundle)
+            self.is_valid(bundle)
+
+            if bundle.errors:
+                raise ImmediateResponse(response=self.error_response(bundle.request, bundle.errors))
+
+        request = bundles[0].request
+        objects = [bundle.obj for bundle in bundles]
+
+        allowed = None
+
+        if getattr(self._meta.authorization, 'create_list_accepts_objects', False):
+            try:
+                allowed = self.is_authorized("create_list", objects, self.build_bundle(request=request))
+            except NotImplementedError:
+                pass
+
+        if allowed is None:
+            allowed = objects
+
+            for bundle in bundles:
+                self.is_authorized("create_detail", self.get_object_list(request), bundle)
+
+        if len(allowed) != len(objects):
+            raise ImmediateResponse(response=self._meta.response_router_obj[request].get_unauthorized_request_response())
+
+        self._meta.object_class._default_manager.bulk_create(objects, batch_size=self._meta.bulk_create_batch_size)
+
+        # New objects have nothing cached under their own keys, so bumping
+        # the list keys once will do.
+        self.invalidate_cache(objects[0], request=bundles[0].request)
+
+        for bundle in bundles:
+            bundle.objects_saved.add(self.create_identifier(bundle.obj))
+            self.fire_event('detail_created', args=(self.get_object_list(request), bundle))
+
+        return bundles
+
     def lookup_kwargs_with_identifiers(self, bundle, kwargs):
         """
         Kwargs here represent uri identifiers Ex: /repos/<user_id>/<repo_name>/
@@ -2585,6 +3770,7 @@ class BaseModelResource(Resource):
         bundle = self.full_hydrate(bundle)
         self.authorized_update_detail(self.get_object_list(bundle.request), bundle)
         bundle = self.save(bundle, skip_errors=skip_errors)
+        self.invalidate_cache(bundle.obj, request=bundle.request)
         self.fire_event('detail_updated', args=(self.get_object_list(bundle.request), bundle))
         return bundle
 
@@ -2602,6 +3788,7 @@ class BaseModelResource(Resource):
         else:
             for authed_obj in deletable_objects:
                 authed_obj.delete()
+        self.invalidate_cache(request=bundle.request)
         self.fire_event('list_deleted', args=(deletable_objects, bundle))
 
     def obj_delete_list_for_update(self, bundle, **kwargs):
@@ -2618,6 +3805,7 @@ class BaseModelResource(Resource):
         else:
             for authed_obj in deletable_objects:
                 authed_obj.delete()
+        self.invalidate_cache(request=bundle.request)
 
     def obj_delete(self, bundle, **kwargs):
         """
@@ -2635,7 +3823,10 @@ class BaseModelResource(Resource):
         self.authorized_delete_detail(self.get_object_list(bundle.request), bundle)
         bundle = self.preprocess('delete_detail', bundle)
         self.fire_event('pre_detail_deleted', args=(self.get_object_list(bundle.request), bundle))
+        # ``delete()`` clears the pk the cache namespaces are built from.
+        deleted = copy(bundle.obj)
         bundle.obj.delete()
+        self.invalidate_cache(deleted, request=bundle.request)
         self.fire_event('detail_deleted', args=(self.get_object_list(bundle.request), bundle))
 
     @commit_on_success()
@@ -1,6 +1,6 @@
 from builtins import object
 from tastypie import http
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.cache import patch_cache_control, patch_vary_headers
 
 
@@ -40,6 +40,9 @@ class HttpResponseDispatcher(object):
     def get_default_response_class(self):
         return HttpResponse
 
+    def get_streaming_response_class(self):
+        return StreamingHttpResponse
+
     def create_response(self, content, response_class=HttpResponse, content_type=None, **response_kwargs):
         return response_class(content=content, content_type=content_type,**response_kwargs)
 
@@ -52,6 +55,9 @@ class HttpResponseDispatcher(object):
     def get_not_found_response(self):
         return http.HttpNotFound()
 
+    def get_not_modified_response(self):
+        return http.HttpNotModified()
+
     def get_multiple_choices_response(self, content):
         return http.HttpMultipleChoices(content)
 
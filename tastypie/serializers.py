@@ -33,11 +33,38 @@ try:
 except ImportError:
     biplist = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 import json
 
 
 XML_ENCODING = re.compile('<\?xml.*?\?>', re.IGNORECASE)
 
+# The kinds of ``Serializer.to_simple`` converters.
+SIMPLE_LEAF = 0
+SIMPLE_LIST = 1
+SIMPLE_DICT = 2
+SIMPLE_UNWRAP = 3
+
+# Types the JSON encoders handle without calling ``default``.
+JSON_NATIVE_TYPES = (six.text_type, float, list, tuple, dict, type(None)) + six.integer_types
+
+
+def simple_identity(data, options):
+    return data
+
+
+def simple_items(data, options):
+    return data.items()
+
 
 # Ugh & blah.
 # So doing a regular dump is generally fine, since Tastypie doesn't usually
@@ -67,6 +94,99 @@ if yaml is not None:
             Resolver.__init__(self)
 
 
+class JSONBackend(object):
+    """
+    Encodes & decodes JSON with the standard library.
+
+    ``dumps`` only ever sees the output of ``Serializer.to_simple``, so
+    dates, decimals & lazy strings have already been turned into native
+    types by the time they get here.
+    """
+    item_separator = ', '
+    key_separator = ': '
+    # Whether ``dumps`` routes every non-native type through ``default``.
+    supports_default = True
+
+    def dumps(self, data, default=None):
+        return json.dumps(data, cls=djangojson.DjangoJSONEncoder, default=default, sort_keys=True,
+                          ensure_ascii=False, separators=(self.item_separator, self.key_separator))
+
+    def loads(self, content):
+        return json.loads(content)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    Encodes & decodes JSON with ``orjson``. The output is compact (no spaces
+    after separators).
+    """
+    item_separator = ','
+    key_separator = ':'
+    supports_default = False
+
+    def dumps(self, data, default=None):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # Integers over 64 bits & types ``to_simple`` let through.
+            return super(OrjsonBackend, self).dumps(data)
+
+    def loads(self, content):
+        return orjson.loads(content)
+
+
+class UjsonBackend(JSONBackend):
+    """
+    Encodes & decodes JSON with ``ujson``. The output is compact (no spaces
+    after separators).
+    """
+    item_separator = ','
+    key_separator = ':'
+    supports_default = False
+
+    def dumps(self, data, default=None):
+        try:
+            return ujson.dumps(data, sort_keys=True, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return super(UjsonBackend, self).dumps(data)
+
+    def loads(self, content):
+        return ujson.loads(content)
+
+
+JSON_BACKENDS = {
+    'json': (JSONBackend, json),
+    'orjson': (OrjsonBackend, orjson),
+    'ujson': (UjsonBackend, ujson),
+}
+
+
+def get_json_backend(backend=None):
+    """
+    Returns a JSON backend instance.
+
+    ``backend`` may be a backend instance or one of the names in
+    ``JSON_BACKENDS``; it defaults to ``settings.TASTYPIE_JSON_BACKEND`` (or
+    ``json``). A backend whose library isn't installed falls back to the
+    standard library one.
+    """
+    if backend is None:
+        backend = getattr(settings, 'TASTYPIE_JSON_BACKEND', 'json')
+
+    if not isinstance(backend, six.string_types):
+        return backend
+
+    try:
+        backend_class, module = JSON_BACKENDS[backend]
+    except KeyError:
+        raise ImproperlyConfigured("Unknown JSON backend '%s'. Choose from: %s." % (backend, ', '.join(sorted(JSON_BACKENDS))))
+
+    if module is None:
+        return JSONBackend()
+
+    return backend_class()
+
+
 class Serializer(object):
     """
     A swappable class for serialization.
@@ -94,12 +214,17 @@ class Serializer(object):
                      'html': 'text/html',
                      'plist': 'application/x-plist'}
 
-    def __init__(self, formats=None, content_types=None, datetime_formatting=None):
+    def __init__(self, formats=None, content_types=None, datetime_formatting=None, json_backend=None):
         if datetime_formatting is not None:
             self.datetime_formatting = datetime_formatting
         else:
             self.datetime_formatting = getattr(settings, 'TASTYPIE_DATETIME_FORMATTING', 'iso-8601')
 
+        self.json_backend = get_json_backend(json_backend)
+        self._simple_converters = self.get_simple_converters()
+        self._simple_converter_cache = {}
+        self._fused_json = self.can_fuse_json()
+
         self.supported_formats = []
 
         if content_types is not None:
@@ -226,47 +351,180 @@ class Serializer(object):
         deserialized = getattr(self, "from_%s" % desired_format)(content)
         return deserialized
 
+    def get_simple_converters(self):
+        """
+        Returns the table ``to_simple`` is driven by, mapping a type to a
+        ``(kind, converter)`` pair.
+
+        ``converter`` is called with ``(data, options)``. For leaves
+        (``SIMPLE_LEAF``) it returns the simplified value, for lists
+        (``SIMPLE_LIST``) the items & for dicts (``SIMPLE_DICT``) the
+        ``(key, value)`` pairs to simplify in turn. ``SIMPLE_UNWRAP``
+        converters return another value to be simplified in their place.
+
+        Types missing from the table are looked up along their MRO, so
+        ``object`` provides the fallback (``force_str``).
+        """
+        converters = {
+            list: (SIMPLE_LIST, simple_identity),
+            tuple: (SIMPLE_LIST, simple_identity),
+            dict: (SIMPLE_DICT, simple_items),
+            Bundle: (SIMPLE_DICT, lambda data, options: data.data.items()),
+            datetime.datetime: (SIMPLE_LEAF, lambda data, options: self.format_datetime(data)),
+            datetime.date: (SIMPLE_LEAF, lambda data, options: self.format_date(data)),
+            datetime.time: (SIMPLE_LEAF, lambda data, options: self.format_time(data)),
+            six.text_type: (SIMPLE_LEAF, simple_identity),
+            bool: (SIMPLE_LEAF, simple_identity),
+            float: (SIMPLE_LEAF, simple_identity),
+            type(None): (SIMPLE_LEAF, simple_identity),
+            object: (SIMPLE_LEAF, lambda data, options: force_str(data)),
+        }
+
+        # ``long`` too, on Python 2.
+        for integer_type in six.integer_types:
+            converters[integer_type] = (SIMPLE_LEAF, simple_identity)
+
+        return converters
+
+    def register_converter(self, data_type, converter):
+        """
+        Teaches ``to_simple`` how to handle ``data_type`` (& its subclasses).
+
+        ``converter`` is called with ``(data, options)`` & whatever it returns
+        is simplified in turn, so it may return anything ``to_simple``
+        already understands. A value of the same type is used as it is.
+        """
+        self._simple_converters[data_type] = (SIMPLE_UNWRAP, converter)
+        self._simple_converter_cache = {}
+        self._fused_json = self.can_fuse_json()
+
+    def can_fuse_json(self):
+        """
+        Decides if ``to_json`` can skip ``to_simple`` & have the JSON encoder
+        call back into the converter table for non-native types instead.
+
+        That only gives the same output if the backend supports a ``default``
+        hook & no converter changes how a JSON-native type is simplified.
+        """
+        if not getattr(self.json_backend, 'supports_default', False):
+            return False
+
+        if type(self).to_simple != Serializer.to_simple:
+            return False
+
+        for data_type, (kind, converter) in self._simple_converters.items():
+            if issubclass(data_type, JSON_NATIVE_TYPES) and converter not in (simple_identity, simple_items):
+                return False
+
+        return True
+
+    def get_json_default(self, options):
+        """
+        Returns a ``default`` hook for the JSON encoder, simplifying one level
+        of a non-native value (a ``Bundle``, a date, a ``Decimal``...) at a
+        time through the converter table.
+        """
+        get_converter = self._get_simple_converter
+        cache = self._simple_converter_cache
+
+        def default(data):
+            kind, convert = cache.get(type(data)) or get_converter(type(data))
+            value = convert(data, options)
+
+            if kind == SIMPLE_LIST:
+                return list(value)
+
+            if kind == SIMPLE_DICT:
+                return dict(value)
+
+            return value
+
+        return default
+
+    def _get_simple_converter(self, data_type):
+        try:
+            return self._simple_converter_cache[data_type]
+        except KeyError:
+            pass
+
+        converters = self._simple_converters
+        entry = converters.get(data_type)
+
+        if entry is None:
+            # Look for ``dehydrated_type`` instead of doing ``isinstance``
+            # on fields, as ``Resource`` does.
+            if hasattr(data_type, 'dehydrated_type') and not issubclass(data_type, (list, tuple, dict, Bundle)):
+                entry = (SIMPLE_UNWRAP, self._simplify_field)
+            else:
+                for klass in data_type.__mro__:
+                    if klass in converters:
+                        entry = converters[klass]
+                        break
+
+        self._simple_converter_cache[data_type] = entry
+        return entry
+
+    def _simplify_field(self, data, options):
+        if getattr(data, 'dehydrated_type', None) == 'related':
+            if data.is_m2m:
+                return list(data.m2m_bundles if data.full else data.value)
+
+            return data.fk_resource if data.full else data.value
+
+        return data.value
+
     def to_simple(self, data, options):
         """
         For a piece of data, attempts to recognize it and provide a simplified
         form of something complex.
 
         This brings complex Python data structures down to native types of the
-        serialization format(s).
-        """
-        if isinstance(data, (list, tuple)):
-            return [self.to_simple(item, options) for item in data]
-        if isinstance(data, dict):
-            return dict((key, self.to_simple(val, options)) for (key, val) in list(data.items()))
-        elif isinstance(data, Bundle):
-            return dict((key, self.to_simple(val, options)) for (key, val) in list(data.data.items()))
-        elif hasattr(data, 'dehydrated_type'):
-            if getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == False:
-                if data.full:
-                    return self.to_simple(data.fk_resource, options)
+        serialization format(s). Types are dispatched through
+        ``get_simple_converters`` & nested data is walked with a stack rather
+        than recursion.
+        """
+        get_converter = self._get_simple_converter
+        cache = self._simple_converter_cache
+        root = [None]
+        stack = [(root, 0, data)]
+
+        while stack:
+            target, key, value = stack.pop()
+            kind, convert = cache.get(type(value)) or get_converter(type(value))
+
+            while kind == SIMPLE_UNWRAP:
+                value_type = type(value)
+                value = convert(value, options)
+
+                if type(value) is value_type:
+                    # Nothing left to unwrap; use the value as it is.
+                    kind, convert = SIMPLE_LEAF, simple_identity
                 else:
-                    return self.to_simple(data.value, options)
-            elif getattr(data, 'dehydrated_type', None) == 'related' and data.is_m2m == True:
-                if data.full:
-                    return [self.to_simple(bundle, options) for bundle in data.m2m_bundles]
-                else:
-                    return [self.to_simple(val, options) for val in data.value]
+                    kind, convert = cache.get(type(value)) or get_converter(type(value))
+
+            if kind == SIMPLE_LEAF:
+                target[key] = convert(value, options)
+                continue
+
+            if kind == SIMPLE_LIST:
+                items = list(convert(value, options))
+                simple = [None] * len(items)
+                items = enumerate(items)
             else:
-                return self.to_simple(data.value, options)
-        elif isinstance(data, datetime.datetime):
-            return self.format_datetime(data)
-        elif isinstance(data, datetime.date):
-            return self.format_date(data)
-        elif isinstance(data, datetime.time):
-            return self.format_time(data)
-        elif isinstance(data, bool):
-            return data
-        elif isinstance(data, (six.integer_types, float)):
-            return data
-        elif data is None:
-            return None
-        else:
-            return force_str(data)
+                items = list(convert(value, options))
+                simple = dict.fromkeys(item_key for item_key, item in items)
+
+            target[key] = simple
+
+            for item_key, item in items:
+                item_kind, item_convert = cache.get(type(item)) or get_converter(type(item))
+
+                if item_kind == SIMPLE_LEAF:
+                    simple[item_key] = item_convert(item, options)
+                else:
+                    stack.append((simple, item_key, item))
+
+        return root[0]
 
     def to_etree(self, data, options=None, name=None, depth=0):
         """
@@ -367,20 +625,58 @@ class Serializer(object):
     def to_json(self, data, options=None):
         """
         Given some Python data, produces JSON output.
+
+        Where ``can_fuse_json`` allows, the data is encoded in a single walk,
+        without building the ``to_simple`` tree first.
         """
         options = options or {}
+
+        if self._fused_json:
+            return self.json_backend.dumps(data, default=self.get_json_default(options))
+
         data = self.to_simple(data, options)
-        if django.get_version() >= '1.5':
-            return djangojson.json.dumps(data, cls=djangojson.DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
-        else:
-            return json.dumps(data, cls=djangojson.DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+        return self.json_backend.dumps(data)
+
+    def to_json_stream(self, data, collection_name, objects, options=None):
+        """
+        Given a page of Python data & an iterable of the objects under its
+        ``collection_name`` key, yields JSON fragments which join up to the
+        output ``to_json`` gives for the whole page.
+
+        Each object is simplified & encoded as it is pulled from ``objects``.
+        """
+        options = options or {}
+        item_separator = self.json_backend.item_separator
+        yield '{'
+
+        for i, key in enumerate(sorted(set(data.keys()) | set([collection_name]))):
+            if i:
+                yield item_separator
+
+            yield self.to_json(key, options) + self.json_backend.key_separator
+
+            if key != collection_name:
+                yield self.to_json(data[key], options)
+                continue
+
+            yield '['
+
+            for j, obj in enumerate(objects):
+                if j:
+                    yield item_separator
+
+                yield self.to_json(obj, options)
+
+            yield ']'
+
+        yield '}'
 
     def from_json(self, content):
         """
         Given some JSON data, returns a Python dictionary of the decoded data.
         """
         try:
-            return json.loads(content)
+            return self.json_backend.loads(content)
         except ValueError:
             raise BadRequest
 
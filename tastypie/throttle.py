@@ -1,7 +1,12 @@
 from __future__ import unicode_literals
 from builtins import object
+import atexit
+import logging
+import os
+import threading
 import time
 from django.core.cache import cache
+from django.db import close_old_connections
 
 
 class BaseThrottle(object):
@@ -104,6 +109,70 @@ class CacheThrottle(BaseThrottle):
         cache.set(key, times_accessed, self.expiration)
 
 
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    A throttling mechanism that uses just the cache, like ``CacheThrottle``,
+    but keeps a counter per ``timeframe``-long window instead of a list of
+    timestamps.
+
+    The number of accesses in the last ``timeframe`` is estimated from the
+    current window's count plus the previous window's, weighted by how much of
+    it still overlaps. Each request costs a ``get_many`` & an ``incr``,
+    however high ``throttle_at`` is, and concurrent requests can't overwrite
+    each other's accesses.
+
+    Counters only live for two windows, so ``expiration`` is unused.
+    """
+    def get_window(self, now=None):
+        """
+        Returns the index of the window ``now`` falls in & how far into it
+        (from 0 to 1) it is.
+        """
+        if now is None:
+            now = time.time()
+
+        window, offset = divmod(now, int(self.timeframe))
+        return int(window), offset / int(self.timeframe)
+
+    def get_window_key(self, identifier, window):
+        return "%s_%s" % (self.convert_identifier_to_key(identifier), window)
+
+    def get_access_count(self, identifier, now=None):
+        """
+        Returns the estimated number of accesses in the last ``timeframe``.
+        """
+        window, elapsed = self.get_window(now)
+        current_key = self.get_window_key(identifier, window)
+        previous_key = self.get_window_key(identifier, window - 1)
+        counts = cache.get_many([current_key, previous_key])
+        return counts.get(current_key, 0) + counts.get(previous_key, 0) * (1 - elapsed)
+
+    def should_be_throttled(self, identifier, **kwargs):
+        """
+        Returns whether or not the user has exceeded their throttle limit.
+
+        Returns ``False`` if the user should NOT be throttled or ``True`` if
+        the user should be throttled.
+        """
+        return self.get_access_count(identifier) >= int(self.throttle_at)
+
+    def accessed(self, identifier, **kwargs):
+        """
+        Handles recording the user's access.
+
+        Atomically increments the current window's counter.
+        """
+        key = self.get_window_key(identifier, self.get_window()[0])
+
+        # The counter is needed until the next window is over.
+        if not cache.add(key, 1, int(self.timeframe) * 2):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Expired between the ``add`` & the ``incr``.
+                cache.add(key, 1, int(self.timeframe) * 2)
+
+
 class CacheDBThrottle(CacheThrottle):
     """
     A throttling mechanism that uses the cache for actual throttling but
@@ -129,3 +198,184 @@ class CacheDBThrottle(CacheThrottle):
             url=kwargs.get('url', ''),
             request_method=kwargs.get('request_method', '')
         )
+
+
+class ApiAccessQueue(object):
+    """
+    A queue of ``ApiAccess`` records kept in the cache, so they can be written
+    to the database in batches, away from the request.
+
+    Each ``push`` costs an ``incr`` & a ``set``. ``drain`` may be called from
+    any process (see the ``drain_api_accesses`` command).
+    """
+    def __init__(self, key_prefix='tastypie_api_access', expiration=604800, grace_period=60):
+        self.key_prefix = key_prefix
+        # How long undrained records are kept.
+        self.expiration = int(expiration)
+        # How long a missing record may still be on its way (between the
+        # ``incr`` & the ``set`` of ``push``) before it counts as evicted.
+        self.grace_period = grace_period
+
+    def get_key(self, name):
+        return "%s_%s" % (self.key_prefix, name)
+
+    def push(self, identifier, url='', request_method=''):
+        """
+        Adds an access (as of now) to the queue. Returns its position.
+        """
+        tail_key = self.get_key('tail')
+
+        try:
+            position = cache.incr(tail_key)
+        except ValueError:
+            cache.add(tail_key, 0, None)
+            position = cache.incr(tail_key)
+
+        cache.set(self.get_key(position), (identifier, url, request_method, int(time.time())), self.expiration)
+        return position
+
+    def drain(self, batch_size=500):
+        """
+        Writes the queued records to the database with ``bulk_create``, in
+        batches of ``batch_size``. Returns the ``ApiAccess`` objects created.
+
+        Only one process drains at a time; the others return straight away.
+
+        Records are written in order, stopping at the first one that's
+        missing, as it may have been pushed but not ``set`` yet. A missing
+        record only counts as evicted (& is skipped) once it has been missing
+        for ``grace_period`` seconds.
+        """
+        # Do the import here, instead of top-level, so that the model is
+        # only required when using this throttling mechanism.
+        from tastypie.models import ApiAccess
+
+        lock_key = self.get_key('lock')
+
+        if not cache.add(lock_key, 1, 300):
+            return []
+
+        created = []
+
+        try:
+            head_key = self.get_key('head')
+            gap_key = self.get_key('gap')
+            head = cache.get(head_key, 0)
+            tail = cache.get(self.get_key('tail'), 0)
+            now = time.time()
+
+            # ``(tail, seen_at)`` as of when a drain last stopped at a missing
+            # record. Every position up to that tail had been pushed by then,
+            # so once the grace period is over, the missing ones are evicted.
+            gap = cache.get(gap_key)
+            evicted_through = head
+
+            if gap is not None and now - gap[1] >= self.grace_period:
+                evicted_through = gap[0]
+
+            while head < tail:
+                positions = list(range(head + 1, min(head + batch_size, tail) + 1))
+                keys = [self.get_key(position) for position in positions]
+                records = cache.get_many(keys)
+                accesses = []
+                new_head = head
+
+                for position, key in zip(positions, keys):
+                    if key in records:
+                        identifier, url, request_method, accessed = records[key]
+                        accesses.append(ApiAccess(identifier=identifier, url=url, request_method=request_method, accessed=accessed))
+                    elif position > evicted_through:
+                        # Possibly still on its way.
+                        break
+
+                    new_head = position
+
+                if accesses:
+                    ApiAccess.objects.bulk_create(accesses)
+                    created.extend(accesses)
+
+                if new_head > head:
+                    cache.delete_many(keys[:new_head - head])
+                    cache.set(head_key, new_head, None)
+                    head = new_head
+
+                if new_head < positions[-1]:
+                    # Stopped at a missing record. Start its grace period,
+                    # unless it's already running.
+                    if gap is None or new_head + 1 > gap[0]:
+                        cache.set(gap_key, (tail, now), None)
+
+                    break
+        finally:
+            cache.delete(lock_key)
+
+        return created
+
+
+class BufferedCacheDBThrottle(CacheDBThrottle):
+    """
+    A version of ``CacheDBThrottle`` that keeps the ``INSERT`` out of the
+    request.
+
+    Accesses go into an ``ApiAccessQueue`` in the cache, which a background
+    thread in each process drains to the database once ``batch_size`` records
+    are waiting or every ``flush_interval`` seconds, and once more when the
+    process exits. The ``drain_api_accesses`` command can drain it too, for
+    instance from cron. With ``flush_interval=None`` there's no thread, and
+    the command is the only way out.
+    """
+    def __init__(self, throttle_at=150, timeframe=3600, expiration=None, batch_size=500, flush_interval=10, queue=None):
+        super(BufferedCacheDBThrottle, self).__init__(throttle_at=throttle_at, timeframe=timeframe, expiration=expiration)
+        self.batch_size = int(batch_size)
+        self.flush_interval = flush_interval
+        self.queue = queue or ApiAccessQueue(expiration=self.expiration)
+        self._flush_event = threading.Event()
+        self._flusher_pid = None
+
+    def accessed(self, identifier, **kwargs):
+        """
+        Handles recording the user's access.
+
+        Does everything the ``CacheThrottle`` class does, plus queues the
+        access for the database.
+        """
+        CacheThrottle.accessed(self, identifier, **kwargs)
+        position = self.queue.push(identifier, url=kwargs.get('url', ''), request_method=kwargs.get('request_method', ''))
+        self.start_flusher()
+
+        if position % self.batch_size == 0:
+            self._flush_event.set()
+
+    def flush(self):
+        """
+        Drains the queue, logging (rather than raising) any failure. The
+        records stay queued for the next attempt.
+        """
+        try:
+            self.queue.drain(batch_size=self.batch_size)
+        except Exception:
+            logging.getLogger('tastypie.throttle').exception("Couldn't write out the queued API accesses.")
+        finally:
+            close_old_connections()
+
+    def start_flusher(self):
+        """
+        Starts the background thread, once per process (including after a
+        ``fork``).
+        """
+        pid = os.getpid()
+
+        if self.flush_interval is None or self._flusher_pid == pid:
+            return
+
+        self._flusher_pid = pid
+        thread = threading.Thread(target=self.run_flusher, name='tastypie-api-access-flusher')
+        thread.daemon = True
+        thread.start()
+        atexit.register(self.flush)
+
+    def run_flusher(self):
+        while True:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
@@ -1,8 +1,8 @@
 from tastypie.utils.dict import dict_strip_unicode_keys, LimitedSizeDict
 from tastypie.utils.formatting import mk_datetime, format_datetime, format_date, format_time
-from tastypie.utils.urls import trailing_slash
+from tastypie.utils.urls import trailing_slash, urlconf_cache_key, UriTrie
 from tastypie.utils.validate_jsonp import is_valid_jsonp_callback_value
-from tastypie.utils.timezone import now, make_aware, make_naive, aware_date, aware_datetime
+from tastypie.utils.timezone import now, make_aware, make_naive, aware_date, aware_datetime, to_timestamp, from_timestamp
 import inspect
 
 import django
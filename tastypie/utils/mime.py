@@ -3,6 +3,30 @@ from __future__ import unicode_literals
 import mimeparse
 
 from tastypie.exceptions import BadRequest
+from tastypie.utils.dict import LimitedSizeDict
+
+
+# ``best_match`` results, keyed on the formats & the raw ``Accept`` header.
+# Clients send few distinct headers, so this stays small & mostly hits.
+best_matches = LimitedSizeDict(size_limit=128)
+
+
+def best_match(formats, accept):
+    """
+    ``mimeparse.best_match``, memoized in a bounded LRU.
+
+    Raises ``ValueError`` for malformed headers, which aren't cached.
+    """
+    key = (tuple(formats), accept)
+
+    try:
+        # Popping & setting again moves the entry to the fresh end.
+        best_format = best_matches.pop(key)
+    except KeyError:
+        best_format = mimeparse.best_match(formats, accept)
+
+    best_matches[key] = best_format
+    return best_format
 
 
 def determine_format(request, serializer, default_format='application/json'):
@@ -39,7 +63,7 @@ def determine_format(request, serializer, default_format='application/json'):
         formats.reverse()
 
         try:
-            best_format = mimeparse.best_match(formats, request.META['HTTP_ACCEPT'])
+            best_format = best_match(formats, request.META['HTTP_ACCEPT'])
         except ValueError:
             raise BadRequest('Invalid Accept header')
 
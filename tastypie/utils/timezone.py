@@ -1,4 +1,5 @@
 from __future__ import unicode_literals
+import calendar
 import datetime
 from django.conf import settings
 
@@ -24,9 +25,24 @@ try:
             return timezone.localtime(timezone.now())
 
         return d
+
+    def to_timestamp(value):
+        """
+        Returns the POSIX timestamp of ``value``. Naive values are taken to be
+        in the default time zone, as Django keeps them with ``USE_TZ = False``.
+        """
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, timezone.get_default_timezone())
+
+        return calendar.timegm(value.utctimetuple())
+
+    def from_timestamp(timestamp):
+        return datetime.datetime.fromtimestamp(timestamp, timezone.utc)
 except ImportError:
     now = datetime.datetime.now
     make_aware = make_naive = lambda x: x
+    to_timestamp = lambda value: calendar.timegm(value.utctimetuple())
+    from_timestamp = datetime.datetime.utcfromtimestamp
 
 
 def aware_date(*args, **kwargs):
@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 from django.conf import settings
+from django.urls import get_script_prefix, get_urlconf
 
 
 def trailing_slash():
@@ -7,3 +8,51 @@ def trailing_slash():
         return '/?'
 
     return '/'
+
+
+def urlconf_cache_key():
+    """
+    Identifies the active URLconf & script prefix, which every reversed URI
+    depends on. Use it to key caches of reversed URIs.
+    """
+    return (get_script_prefix(), get_urlconf() or settings.ROOT_URLCONF)
+
+
+class UriTrie(object):
+    """
+    Maps URI prefixes to values, one ``/``-separated segment per level.
+
+    Looking a URI up walks its segments, so it costs the length of the URI
+    rather than the number of prefixes.
+    """
+    def __init__(self):
+        self.root = {}
+
+    def split(self, uri):
+        return [segment for segment in uri.split('/') if segment]
+
+    def add(self, prefix, value):
+        node = self.root
+
+        for segment in self.split(prefix):
+            node = node.setdefault(segment, {})
+
+        # ``None`` can't clash with a segment, which is always a string.
+        node[None] = value
+
+    def lookup(self, uri):
+        """
+        Returns the value of the longest prefix of ``uri``, or ``None``.
+        """
+        node = self.root
+        found = node.get(None)
+
+        for segment in self.split(uri):
+            node = node.get(segment)
+
+            if node is None:
+                break
+
+            found = node.get(None, found)
+
+        return found
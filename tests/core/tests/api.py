@@ -121,6 +121,22 @@ class ApiTestCase(TestCase):
         self.assertEqual(sorted([pattern.name for pattern in patterns if hasattr(pattern, 'name')]), ['api_v2_top_level'])
         self.assertEqual([[pattern.name for pattern in include.url_patterns if hasattr(pattern, 'name')] for include in patterns if hasattr(include, 'reverse_dict')], [['api_dispatch_list', 'api_get_schema', 'api_get_multiple', 'api_dispatch_detail'], ['api_dispatch_list', 'api_get_schema', 'api_get_multiple', 'api_dispatch_detail']])
 
+    def test_resource_for_uri(self):
+        api = Api()
+        note_resource = NoteResource()
+        user_resource = UserResource()
+        api.register(note_resource)
+        api.register(user_resource)
+
+        self.assertEqual(api.resource_for_uri('/api/v1/notes/'), note_resource)
+        self.assertEqual(api.resource_for_uri('/api/v1/notes/1/'), note_resource)
+        self.assertEqual(api.resource_for_uri('/api/v1/users/1/'), user_resource)
+        self.assertEqual(api.resource_for_uri('/api/v1/'), None)
+        self.assertEqual(api.resource_for_uri('/api/v2/notes/1/'), None)
+
+        api.unregister('users')
+        self.assertEqual(api.resource_for_uri('/api/v1/users/1/'), None)
+
     def test_top_level(self):
         api = Api()
         api.register(NoteResource())
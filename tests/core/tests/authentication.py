@@ -6,6 +6,7 @@ import unittest
 import warnings
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
 from django.http import HttpRequest
 from django.test import TestCase
 from django.test.testcases import skipIf
@@ -225,6 +226,44 @@ class ApiKeyAuthenticationTestCase(TestCase):
         request.META['HTTP_AUTHORIZATION'] = 'ApiKey bobdoe:%s' % bob_doe.api_key.key
         self.assertTrue(auth.is_authenticated(request))
 
+    def test_cached_credentials(self):
+        auth = ApiKeyAuthentication(cache_timeout=60, negative_cache_timeout=60)
+        request = HttpRequest()
+
+        john_doe = User.objects.get(username='johndoe')
+        create_api_key(User, instance=john_doe, created=True)
+        api_key = ApiKey.objects.get(user=john_doe)
+        cache.clear()
+
+        request.META['HTTP_AUTHORIZATION'] = 'ApiKey johndoe:%s' % api_key.key
+
+        # The user & key are checked in one query.
+        with self.assertNumQueries(1):
+            self.assertEqual(auth.is_authenticated(request), True)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(auth.is_authenticated(request), True)
+
+        self.assertEqual(request.user.username, 'johndoe')
+
+        # Refusals are cached too.
+        request.META['HTTP_AUTHORIZATION'] = 'ApiKey johndoe:pass'
+
+        with self.assertNumQueries(1):
+            self.assertFalse(auth.is_authenticated(request))
+
+        with self.assertNumQueries(0):
+            self.assertFalse(auth.is_authenticated(request))
+
+        # Changing the key drops the cached entries.
+        old_key = api_key.key
+        api_key.key = 'pass'
+        api_key.save()
+        self.assertEqual(auth.is_authenticated(request), True)
+
+        request.META['HTTP_AUTHORIZATION'] = 'ApiKey johndoe:%s' % old_key
+        self.assertFalse(auth.is_authenticated(request))
+
 
 class SessionAuthenticationTestCase(TestCase):
     fixtures = ['note_testdata.json']
@@ -28,11 +28,19 @@ class NoCacheTestCase(TestCase):
         self.assertEqual(cache.get('foo'), None)
         self.assertEqual(cache.get('moof'), None)
 
+    def test_generations(self):
+        no_cache = NoCache()
+        self.assertEqual(no_cache.get_generations(['foo', 'moof']), [None, None])
+        no_cache.bump_generation('foo')
+        self.assertEqual(no_cache.get_generations(['foo']), [None])
+
 
 class SimpleCacheTestCase(TestCase):
     def tearDown(self):
         cache.delete('foo')
         cache.delete('moof')
+        cache.delete('tastypie:generation:foo')
+        cache.delete('tastypie:generation:moof')
         super(SimpleCacheTestCase, self).tearDown()
 
     def test_get(self):
@@ -57,3 +65,15 @@ class SimpleCacheTestCase(TestCase):
         time.sleep(2)
         self.assertEqual(cache.get('moof'), None)
         self.assertEqual(cache.get('foo'), 'bar')
+
+    def test_generations(self):
+        simple_cache = SimpleCache()
+        foo, moof = simple_cache.get_generations(['foo', 'moof'])
+        self.assertEqual(simple_cache.get_generations(['foo', 'moof']), [foo, moof])
+
+        self.assertEqual(simple_cache.bump_generation('foo'), foo + 1)
+        self.assertEqual(simple_cache.get_generations(['foo', 'moof']), [foo + 1, moof])
+
+        # A lost counter starts again past the old values.
+        cache.delete('tastypie:generation:foo')
+        self.assertTrue(simple_cache.bump_generation('foo') > foo + 1)
@@ -1,8 +1,10 @@
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.management import call_command
 from django.db import models
 from django.test import TestCase
-from tastypie.models import ApiKey, create_api_key
+from tastypie.models import ApiAccess, ApiKey, create_api_key
+from tastypie.throttle import ApiAccessQueue
 
 
 class BackfillApiKeysTestCase(TestCase):
@@ -38,3 +40,22 @@ class BackfillApiKeysTestCase(TestCase):
             api_key = ApiKey.objects.get(user=new_user)
         except ApiKey.DoesNotExist:
             self.fail("No key means the command didn't work.")
+
+
+class DrainApiAccessesTestCase(TestCase):
+    def tearDown(self):
+        for name in ('head', 'tail', 'lock', 'gap', 1, 2, 3):
+            cache.delete('tastypie_api_access_%s' % name)
+
+        super(DrainApiAccessesTestCase, self).tearDown()
+
+    def test_command(self):
+        queue = ApiAccessQueue()
+        queue.push('daniel', url='/api/v1/notes/', request_method='GET')
+        queue.push('cody')
+        queue.push('daniel')
+        self.assertEqual(ApiAccess.objects.count(), 0)
+
+        call_command('drain_api_accesses', verbosity=0, batch_size=2)
+        self.assertEqual(ApiAccess.objects.count(), 3)
+        self.assertEqual(ApiAccess.objects.filter(identifier='daniel').count(), 2)
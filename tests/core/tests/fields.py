@@ -5,8 +5,10 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.test import TestCase
 from django.http import HttpRequest
+from django.test import RequestFactory
+from tastypie.authorization import Authorization
 from tastypie.bundle import Bundle
-from tastypie.exceptions import ApiFieldError, NotFound
+from tastypie.exceptions import ApiFieldError, ImmediateResponse, NotFound, Unauthorized
 from tastypie.fields import *
 from tastypie.resources import ModelResource
 from core.models import Note, Subject, MediaBit
@@ -94,6 +96,32 @@ class ApiFieldTestCase(TestCase):
         field_6 = ApiField(attribute='what_time_is_it', default=True)
         self.assertEqual(field_6.dehydrate(bundle), aware_datetime(2010, 4, 1, 0, 48))
 
+    def test_attribute_accessor(self):
+        note = Note.objects.get(pk=1)
+
+        accessor = AttributeAccessor('author__username')
+        self.assertEqual(accessor.path, ('author', 'username'))
+        self.assertEqual(accessor.lookups, ('author', 'author__username'))
+
+        field_1 = ApiField(attribute='title')
+        field_1.contribute_to_class(ModelResource, 'api')
+        accessor_1 = field_1.attribute_accessor
+        self.assertEqual(accessor_1.path, ('title',))
+        self.assertEqual(accessor_1(note), u'First Post!')
+        # Compiled once & reused.
+        self.assertTrue(field_1.attribute_accessor is accessor_1)
+
+        # Reassigning the attribute recompiles.
+        field_1.attribute = 'slug'
+        self.assertEqual(field_1.attribute_accessor(note), u'first-post')
+
+        field_2 = ApiField(attribute='foo__bar')
+        self.assertRaises(AttributeError, field_2.attribute_accessor, note)
+
+        field_3 = ApiField()
+        self.assertEqual(field_3.attribute_accessor.path, ())
+        self.assertRaises(AttributeError, field_3.attribute_accessor, note)
+
     def test_convert(self):
         field_1 = ApiField()
         self.assertEqual(field_1.convert('foo'), 'foo')
@@ -921,6 +949,22 @@ class SubjectResource(ModelResource):
         return '/api/v1/subjects/%s/' % bundle_or_obj.obj.id
 
 
+class PhotosHiddenAuthorization(Authorization):
+    def read_list(self, object_list, bundle):
+        return object_list
+
+    def read_detail(self, object_list, bundle):
+        if bundle.obj.name == 'Photos':
+            raise Unauthorized("You are not allowed to access that resource.")
+
+        return True
+
+
+class PhotosHiddenSubjectResource(SubjectResource):
+    class Meta(SubjectResource.Meta):
+        authorization = PhotosHiddenAuthorization()
+
+
 class MediaBitResource(ModelResource):
     class Meta(object):
         resource_name = 'mediabits'
@@ -1094,6 +1138,32 @@ class ToManyFieldTestCase(TestCase):
         except ApiFieldError:
             pass
 
+    def test_dehydrate_shares_related_resource(self):
+        field_1 = ToManyField(SubjectResource, 'subjects')
+        field_1.instance_name = 'm2m'
+        request = MockRequest()
+        self.assertEqual(field_1.dehydrate(Bundle(obj=self.note_1, request=request)), ['/api/v1/subjects/1/', '/api/v1/subjects/2/'])
+        related_resource = field_1.m2m_resources[0]
+        self.assertEqual(field_1.dehydrate(Bundle(obj=self.note_2, request=request)), ['/api/v1/subjects/1/', '/api/v1/subjects/3/'])
+
+        # One related resource for every subject of both notes.
+        self.assertTrue(all(m2m_resource is related_resource for m2m_resource in field_1.m2m_resources))
+        self.assertEqual(list(request._tastypie_related_resources.values()), [related_resource])
+
+        # Another request gets its own.
+        self.assertEqual(field_1.dehydrate(Bundle(obj=self.note_1, request=MockRequest())), ['/api/v1/subjects/1/', '/api/v1/subjects/2/'])
+        self.assertFalse(field_1.m2m_resources[0] is related_resource)
+
+    def test_dehydrate_full_shared_related_resource(self):
+        field_1 = ToManyField(SubjectResource, 'subjects', full=True)
+        field_1.instance_name = 'm2m'
+        subject_bundle_list = field_1.dehydrate(Bundle(obj=self.note_1, request=MockRequest()))
+        self.assertEqual([subject_bundle.obj.name for subject_bundle in subject_bundle_list], [u'News', u'Photos'])
+        self.assertEqual([subject_bundle.data['name'] for subject_bundle in subject_bundle_list], [u'News', u'Photos'])
+
+        # Each related object is passed along, not set on the shared resource.
+        self.assertEqual(field_1.m2m_resources[1].instance.name, u'News')
+
     def test_dehydrate_full_detail_list(self):
         #details path with full_detail=False
         field_1 = ToManyField(SubjectResource, 'subjects', full=True, full_detail=False)
@@ -1329,6 +1399,66 @@ class ToManyFieldTestCase(TestCase):
         self.assertEqual(len(media_bundle_list), 1)
         self.assertEqual(media_bundle_list[0].obj.title, u'Foo!')
 
+    def test_hydrate_m2m_via_uris(self):
+        field_1 = ToManyField(SubjectResource, 'subjects')
+        field_1.instance_name = 'm2m'
+        uris = ['/api/v1/subjects/%s/' % subject.pk for subject in (self.subject_1, self.subject_2, self.subject_3)]
+        bundle_1 = Bundle(data={'m2m': uris})
+
+        # One query, however many URIs.
+        with self.assertNumQueries(1):
+            subject_bundle_list = field_1.hydrate_m2m(bundle_1)
+
+        self.assertEqual([subject_bundle.obj for subject_bundle in subject_bundle_list], [self.subject_1, self.subject_2, self.subject_3])
+        self.assertEqual(subject_bundle_list[0].data, {})
+        self.assertEqual(len(bundle_1.objects_saved), 3)
+
+        # Missing objects still error out.
+        bundle_2 = Bundle(data={'m2m': uris + ['/api/v1/subjects/999/']})
+        self.assertRaises(ApiFieldError, field_1.hydrate_m2m, bundle_2)
+
+        # A single URI takes the same path.
+        bundle_3 = Bundle(data={'m2m': uris[:1]})
+
+        with self.assertNumQueries(1):
+            self.assertEqual([subject_bundle.obj for subject_bundle in field_1.hydrate_m2m(bundle_3)], [self.subject_1])
+
+        self.assertTrue(isinstance(field_1.fk_resource, SubjectResource))
+
+    def test_hydrate_m2m_via_uris_read_detail(self):
+        # Every object is checked with ``read_detail``, as one at a time.
+        field_1 = ToManyField(PhotosHiddenSubjectResource, 'subjects')
+        field_1.instance_name = 'm2m'
+        request = RequestFactory().post('/')
+        uris = ['/api/v1/subjects/%s/' % subject.pk for subject in (self.subject_1, self.subject_3)]
+        self.assertEqual(len(field_1.hydrate_m2m(Bundle(data={'m2m': uris}, request=request))), 2)
+
+        for uris in (['/api/v1/subjects/%s/' % self.subject_2.pk], uris + ['/api/v1/subjects/%s/' % self.subject_2.pk]):
+            bundle = Bundle(data={'m2m': uris}, request=request)
+            self.assertRaises(ImmediateResponse, field_1.hydrate_m2m, bundle)
+
+    def test_save(self):
+        subject_4 = Subject.objects.create(name='Sports', url='/sports/')
+        subject_resource = SubjectResource()
+
+        for bulk_through in (False, True):
+            field_1 = ToManyField(SubjectResource, 'subjects', bulk_through=bulk_through)
+            field_1.instance_name = 'subjects'
+            subjects = [self.subject_2, self.subject_3, subject_4]
+            bundle = Bundle(obj=self.note_1, data={'subjects': [Bundle(obj=subject) for subject in subjects]})
+            # Already saved, so only the relation is touched.
+            bundle.objects_saved.update(subject_resource.create_identifier(subject) for subject in subjects)
+
+            # Fetch the current pks, then one remove & one add.
+            field_1.save(bundle)
+            self.assertEqual(sorted(self.note_1.subjects.values_list('pk', flat=True)), sorted(subject.pk for subject in subjects))
+
+            # Nothing to do the second time around.
+            with self.assertNumQueries(1):
+                field_1.save(bundle)
+
+            self.note_1.subjects.set([self.subject_1, self.subject_2])
+
     def test_traversed_attribute_dehydrate(self):
         mediabit = MediaBit(id=1, note=self.note_1)
         bundle = Bundle(obj=mediabit)
@@ -1,13 +1,21 @@
 # -*- coding: utf-8 -*-
 from builtins import str
+import base64
+import json
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
+from tastypie.cache import SimpleCache
 from tastypie.exceptions import BadRequest
-from tastypie.paginator import Paginator
+from tastypie.paginator import Paginator, CursorPaginator
 from core.models import Note
 from core.tests.resources import NoteResource
 from django.db import reset_queries
 from django.http import QueryDict
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
 
 
 class PaginatorTestCase(TestCase):
@@ -282,3 +290,100 @@ class PaginatorTestCase(TestCase):
         meta = paginator.page()['meta']
         self.assertEqual(meta['limit'], 0)
 
+    def test_count_strategy_cached(self):
+        cache = SimpleCache(cache_name='default')
+        paginator = Paginator({'limit': 2}, self.data_set, resource_uri='/api/v1/notes/', count_strategy='cached', cache=cache, cache_key='notes:count')
+        self.assertEqual(paginator.page()['meta']['total_count'], 6)
+
+        # Served from the cache, so only the page is fetched.
+        reset_queries()
+        paginator = Paginator({'limit': 2, 'offset': 2}, self.data_set, resource_uri='/api/v1/notes/', count_strategy='cached', cache=cache, cache_key='notes:count')
+        self.assertEqual(paginator.page()['meta']['total_count'], 6)
+        self.assertEqual(len(self._get_query_count()), 1)
+
+        # Other filters get their own count.
+        paginator = Paginator({}, self.data_set.filter(is_active=True), count_strategy='cached', cache=cache, cache_key='notes:count')
+        self.assertEqual(paginator.page()['meta']['total_count'], 4)
+
+    def test_count_strategy_estimate(self):
+        # SQLite keeps no estimate, so the count is exact.
+        paginator = Paginator({}, self.data_set, count_strategy='estimate')
+        self.assertEqual(paginator.get_estimated_count(), None)
+        self.assertEqual(paginator.page()['meta']['total_count'], 6)
+
+    def test_count_strategy_none(self):
+        reset_queries()
+        paginator = Paginator({'limit': 2, 'offset': 2}, self.data_set, resource_uri='/api/v1/notes/', count_strategy='none')
+        page = paginator.page()
+        self.assertEqual(len(self._get_query_count()), 1)
+        self.assertFalse('total_count' in page['meta'])
+        self.assertEqual(len(page['objects']), 2)
+        self.assertEqual(page['meta']['previous'], '/api/v1/notes/?limit=2&offset=0')
+        self.assertEqual(page['meta']['next'], '/api/v1/notes/?limit=2&offset=4')
+
+        paginator = Paginator({'limit': 2, 'offset': 4}, self.data_set, resource_uri='/api/v1/notes/', count_strategy='none')
+        page = paginator.page()
+        self.assertEqual(len(page['objects']), 2)
+        self.assertEqual(page['meta']['next'], None)
+
+        self.assertRaises(ImproperlyConfigured, Paginator, {}, self.data_set, count_strategy='nope')
+
+
+class CursorPaginatorTestCase(TestCase):
+    fixtures = ['note_testdata.json']
+
+    def _walk(self, request_data, objects, link='next'):
+        pages = []
+
+        while True:
+            page = CursorPaginator(request_data, objects, resource_uri='/api/v1/notes/').page()
+            pages.append(page['objects'])
+
+            if not page['meta'][link]:
+                return pages, page
+
+            request_data = QueryDict(urlparse(page['meta'][link]).query)
+
+    def test_page(self):
+        paginator = CursorPaginator({'limit': 2}, Note.objects.order_by('-title'), resource_uri='/api/v1/notes/')
+
+        # One query for the page & the extra object; no ``COUNT``.
+        with self.assertNumQueries(1):
+            page = paginator.page()
+
+        self.assertEqual(page['objects'], list(Note.objects.order_by('-title', 'pk')[:2]))
+        self.assertEqual(page['meta']['limit'], 2)
+        self.assertEqual(page['meta']['offset'], None)
+        self.assertEqual(page['meta']['total_count'], None)
+        self.assertEqual(page['meta']['previous'], None)
+        self.assertTrue(page['meta']['next'].startswith('/api/v1/notes/?'))
+        self.assertTrue('cursor=' in page['meta']['next'])
+
+    def test_walk(self):
+        for ordering in (['title'], ['-is_active', 'title'], ['-created'], []):
+            objects = Note.objects.order_by(*ordering) if ordering else Note.objects.all()
+            expected = list(objects.order_by(*(ordering + ['pk'])))
+
+            pages, last_page = self._walk(QueryDict('limit=2&format=json'), objects)
+            self.assertEqual([obj for page in pages for obj in page], expected)
+
+            previous_pages, first_page = self._walk(QueryDict(urlparse(last_page['meta']['previous']).query), objects, link='previous')
+            self.assertEqual(list(reversed(previous_pages)), pages[:-1])
+            self.assertTrue('format=json' in first_page['meta']['next'])
+
+    def test_invalid(self):
+        paginator = CursorPaginator({'cursor': 'abc'}, Note.objects.all())
+        self.assertRaises(BadRequest, paginator.page)
+
+        # Well-formed, but with values that don't fit the fields.
+        for values in (['yesterday', 1], ['2010-04-01T20:05:00', 'abc'], [[1], {}]):
+            cursor = base64.urlsafe_b64encode(json.dumps({'d': 'next', 'v': values}).encode('utf-8')).decode('ascii')
+            paginator = CursorPaginator({'cursor': cursor}, Note.objects.order_by('-created'))
+            self.assertRaises(BadRequest, paginator.page)
+
+        paginator = CursorPaginator({}, Note.objects.order_by('?'))
+        self.assertRaises(ImproperlyConfigured, paginator.page)
+
+        paginator = CursorPaginator({}, list(Note.objects.all()))
+        self.assertRaises(ImproperlyConfigured, paginator.page)
+
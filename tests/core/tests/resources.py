@@ -13,16 +13,19 @@ from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.core.exceptions import FieldError, MultipleObjectsReturned
 from django.core import mail
+from django.db import connection
 from django.core.urlresolvers import reverse
 from django import forms
-from django.http import HttpRequest, QueryDict, Http404
-from django.test import TestCase
+from django.http import HttpRequest, HttpResponse, QueryDict, Http404
+from django.test import RequestFactory, TestCase
 from django.utils.encoding import force_str
+from django.utils.timezone import utc
 import six
 
-from tastypie.authentication import BasicAuthentication
+from tastypie.authentication import Authentication, BasicAuthentication
 from tastypie.authorization import Authorization
 from tastypie.bundle import Bundle
+from tastypie.cache import SimpleCache
 from tastypie.exceptions import InvalidFilterError, InvalidSortError, ImmediateResponse, BadRequest, NotFound
 from tastypie import fields
 from tastypie.paginator import Paginator
@@ -163,6 +166,32 @@ class NullableNameResource(Resource):
         authorization = Authorization()
 
 
+class CountingAuthentication(Authentication):
+    calls = []
+
+    def is_authenticated(self, request, **kwargs):
+        self.calls.append('is_authenticated')
+        return True
+
+    def get_identifier(self, request):
+        self.calls.append('get_identifier')
+        return 'johndoe'
+
+
+class CountingAuthenticationResource(BasicResource):
+    class Meta(object):
+        object_class = TestObject
+        resource_name = 'countingauth'
+        authentication = CountingAuthentication()
+        authorization = Authorization()
+
+
+class OtherCountingAuthenticationResource(CountingAuthenticationResource):
+    class Meta(CountingAuthenticationResource.Meta):
+        resource_name = 'othercountingauth'
+        authentication = CountingAuthentication()
+
+
 class MangledBasicResource(BasicResource):
     class Meta(object):
         object_class = TestObject
@@ -389,6 +418,41 @@ class ResourceTestCase(TestCase):
         self.assertEqual(bundle_2.data['view_count'], 12)
         self.assertEqual(bundle_2.data.get('date_joined'), None)
 
+    def test_get_dehydration_plan(self):
+        basic = BasicResourceWithDifferentListAndDetailFields()
+
+        detail_plan = basic.get_dehydration_plan()
+        self.assertEqual(sorted([name for name, use_in, hook_name in detail_plan]), ['name', 'resource_uri', 'view_count'])
+        self.assertEqual(dict((name, hook_name) for name, use_in, hook_name in detail_plan)['resource_uri'], 'dehydrate_resource_uri')
+        self.assertEqual(dict((name, hook_name) for name, use_in, hook_name in detail_plan)['name'], None)
+
+        list_plan = basic.get_dehydration_plan(for_list=True)
+        self.assertEqual(sorted([name for name, use_in, hook_name in list_plan]), ['date_joined', 'name', 'resource_uri'])
+        self.assertEqual(dict((name, hook_name) for name, use_in, hook_name in list_plan)['date_joined'], 'dehydrate_date_joined')
+
+        # Plans are compiled once per class & shared between instances.
+        self.assertTrue(BasicResourceWithDifferentListAndDetailFields().get_dehydration_plan() is detail_plan)
+        self.assertFalse(BasicResource().get_dehydration_plan() is detail_plan)
+
+        # Instances with other fields get their own plan.
+        trimmed = BasicResourceWithDifferentListAndDetailFields()
+        del trimmed.fields['view_count']
+        trimmed.fields['nickname'] = fields.CharField(attribute='name')
+        self.assertEqual(sorted([name for name, use_in, hook_name in trimmed.get_dehydration_plan()]), ['name', 'nickname', 'resource_uri'])
+        self.assertTrue(BasicResourceWithDifferentListAndDetailFields().get_dehydration_plan() is detail_plan)
+
+        test_object = TestObject()
+        test_object.name = 'Daniel'
+        bundle = trimmed.full_dehydrate(trimmed.build_bundle(obj=test_object))
+        self.assertEqual(bundle.data['nickname'], 'Daniel')
+        self.assertFalse('view_count' in bundle.data)
+
+        # Callable ``use_in`` is kept for the per-bundle check.
+        callable_plan = dict((name, use_in) for name, use_in, hook_name in BasicResourceWithDifferentListAndDetailFieldsCallable().get_dehydration_plan())
+        self.assertEqual(sorted(callable_plan.keys()), ['date_joined', 'name', 'resource_uri', 'view_count'])
+        self.assertEqual(callable_plan['name'], None)
+        self.assertTrue(callable(callable_plan['view_count']))
+
     def test_full_dehydrate(self):
         test_object_1 = TestObject()
         test_object_1.name = 'Daniel'
@@ -753,6 +817,27 @@ class ResourceTestCase(TestCase):
         except:
             self.fail()
 
+    def test_auth_memoized(self):
+        resource = CountingAuthenticationResource()
+        other = OtherCountingAuthenticationResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        del CountingAuthentication.calls[:]
+
+        resource.is_authenticated(request)
+        resource.is_authenticated(request)
+        self.assertEqual(resource.get_identifier(request), 'johndoe')
+        self.assertEqual(resource.get_identifier(request), 'johndoe')
+
+        # An equivalent backend (like a sub-resource's) reuses the results.
+        other.is_authenticated(request)
+        self.assertEqual(other.get_identifier(request), 'johndoe')
+        self.assertEqual(CountingAuthentication.calls, ['is_authenticated', 'get_identifier'])
+
+        # A new request starts over.
+        resource.is_authenticated(HttpRequest())
+        self.assertEqual(CountingAuthentication.calls, ['is_authenticated', 'get_identifier', 'is_authenticated'])
+
     def test_create_response(self):
         basic = BasicResource()
         request = HttpRequest()
@@ -769,6 +854,29 @@ class ResourceTestCase(TestCase):
         self.assertEqual(output.status_code, 200)
         self.assertEqual(force_str(output.content), '<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<response><meta type="hash"><page type="integer">1</page></meta><objects type="list"><object type="hash"><abc type="integer">123</abc><hello>world</hello></object></objects></response>')
 
+    def test_get_request_format(self):
+        basic = BasicResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+
+        # Outside of ``wrap_view``, it's negotiated on every call.
+        self.assertEqual(basic.get_request_format(request), 'application/json')
+        request.GET = {'format': 'xml'}
+        self.assertEqual(basic.get_request_format(request), 'application/xml')
+
+        # Within it, once per request.
+        calls = []
+
+        def determine_format(request):
+            calls.append(request.GET['format'])
+            return BasicResource.determine_format(basic, request)
+
+        basic.determine_format = determine_format
+        basic.get_request_format_twice = lambda request: HttpResponse(basic.get_request_format(request) + basic.get_request_format(request))
+        response = basic.wrap_view('get_request_format_twice')(RequestFactory().get('/', {'format': 'xml'}))
+        self.assertEqual(force_str(response.content), 'application/xmlapplication/xml')
+        self.assertEqual(calls, ['xml'])
+
     def test_mangled(self):
         mangled = MangledBasicResource()
         request = HttpRequest()
@@ -835,6 +943,65 @@ class NoteResource(ModelResource):
 
         return '/api/v1/notes/%s/' % bundle_or_obj.obj.id
 
+
+class StreamHintNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'streamhintnotes'
+        allow_stream_hint = True
+
+
+class AlteredStreamHintNoteResource(StreamHintNoteResource):
+    class Meta(StreamHintNoteResource.Meta):
+        resource_name = 'alteredstreamhintnotes'
+        stream_list_responses = True
+
+    def alter_list_data_to_serialize(self, request, data):
+        data['meta'] = {'altered': True}
+        return data
+
+
+class CachedCountNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'cachedcountnotes'
+        cache = SimpleCache(timeout=3600)
+        count_strategy = 'cached'
+
+
+class EstimatedCountNoteResource(CachedCountNoteResource):
+    class Meta(CachedCountNoteResource.Meta):
+        resource_name = 'estimatedcountnotes'
+        count_strategy = 'estimate'
+
+
+class CachedResponseNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'cachedresponsenotes'
+        cache = SimpleCache(timeout=3600)
+        cache_responses = True
+
+
+class ConditionalNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'conditionalnotes'
+        conditional_get = True
+        last_modified_field = 'updated'
+
+
+class CachedConditionalNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'cachedconditionalnotes'
+        cache = SimpleCache(timeout=3600)
+        cache_responses = True
+        conditional_get = True
+        last_modified_field = 'updated'
+
+
+class BodyConditionalNoteResource(NoteResource):
+    class Meta(NoteResource.Meta):
+        resource_name = 'bodyconditionalnotes'
+        conditional_get = True
+
+
 class NoQuerysetNoteResource(ModelResource):
     class Meta(object):
         resource_name = 'noqsnotes'
@@ -1061,6 +1228,77 @@ class RelatedNoteResource(ModelResource):
         authorization = Authorization()
 
 
+class BulkCreateNoteResource(RelatedNoteResource):
+    class Meta(RelatedNoteResource.Meta):
+        resource_name = 'bulkcreatenotes'
+        bulk_create = True
+        bulk_create_batch_size = 2
+
+
+class QuerySetCreateListAuthorization(Authorization):
+    def create_list(self, object_list, bundle):
+        # Only works on a ``QuerySet``.
+        return object_list.filter(is_active=True)
+
+    def create_detail(self, object_list, bundle):
+        return True
+
+
+class BulkCreateDetailNoteResource(BulkCreateNoteResource):
+    class Meta(BulkCreateNoteResource.Meta):
+        resource_name = 'bulkcreatedetailnotes'
+        authorization = QuerySetCreateListAuthorization()
+
+
+class AutoOptimizeUserResource(ModelResource):
+    notes = fields.ToManyField(SubjectResource, 'notes__subjects', full=True)
+
+    class Meta(object):
+        queryset = User.objects.all()
+        resource_name = 'autousers'
+        fields = ['username']
+        authorization = Authorization()
+
+
+class AutoOptimizeNoteResource(ModelResource):
+    author = fields.ForeignKey(AutoOptimizeUserResource, 'author', full=True)
+    subjects = fields.ManyToManyField(SubjectResource, 'subjects')
+
+    class Meta(object):
+        queryset = Note.objects.all()
+        resource_name = 'autonotes'
+        fields = ['title']
+        auto_optimize = True
+        authorization = Authorization()
+
+
+class AutoOptimizeDetailNoteResource(AutoOptimizeNoteResource):
+    author = fields.ForeignKey(AutoOptimizeUserResource, 'author', full=True, full_list=False, full_detail=True)
+    subjects = fields.ManyToManyField(SubjectResource, 'subjects', use_in=lambda bundle, for_list: True)
+
+    class Meta(AutoOptimizeNoteResource.Meta):
+        resource_name = 'autodetailnotes'
+
+
+class ProjectedNoteResource(ModelResource):
+    author = fields.ForeignKey(UserResource, 'author')
+    subjects = fields.ManyToManyField(SubjectResource, 'subjects')
+
+    class Meta(object):
+        queryset = Note.objects.all()
+        resource_name = 'projectednotes'
+        fields = ['title', 'slug']
+        project_columns = True
+        authorization = Authorization()
+
+
+class ProjectedPropertyNoteResource(ProjectedNoteResource):
+    my_property = fields.CharField(attribute='my_property')
+
+    class Meta(ProjectedNoteResource.Meta):
+        resource_name = 'projectedpropertynotes'
+
+
 class AnotherSubjectResource(ModelResource):
     notes = fields.ToManyField(DetailedNoteResource, 'notes')
 
@@ -1525,6 +1763,46 @@ class ModelResourceTestCase(TestCase):
         note_1 = resource.get_via_uri('/api/v1/notes/1/', request=request)
         self.assertEqual(note_1.pk, 1)
 
+    def test_get_resource_uri_template(self):
+        resource = NoteResource(api_name='v1')
+        note = Note.objects.get(pk=1)
+        self.assertEqual(resource.get_resource_uri_template('api_dispatch_detail', resource.resource_uri_kwargs(note)), ('/api/v1/notes/%(pk)s/', ('pk',)))
+        self.assertEqual(resource.get_resource_uri_template('api_dispatch_list', resource.resource_uri_kwargs()), ('/api/v1/notes/', ()))
+        self.assertEqual(resource.get_resource_uri(note), '/api/v1/notes/1/')
+        self.assertEqual(resource.get_resource_uri(), '/api/v1/notes/')
+
+        # Values ``reverse`` would quote (or reject) still go through it.
+        note.pk = 'a-b'
+        self.assertEqual(resource.get_resource_uri(note), '')
+
+        # So do URIs of resources that customize their URLs.
+        class PrependedNoteResource(NoteResource):
+            def prepend_urls(self):
+                return []
+
+        resource = PrependedNoteResource(api_name='v1')
+        self.assertEqual(resource.get_resource_uri_template('api_dispatch_list', resource.resource_uri_kwargs()), (None, ()))
+        self.assertEqual(resource.get_resource_uri(), '/api/v1/notes/')
+
+    def test_parse_detail_uri(self):
+        resource = NoteResource(api_name='v1')
+        self.assertEqual(resource.get_detail_uri_pattern().pattern, r'^/api/v1/notes/(?P<identifier>\w+)/$')
+        self.assertEqual(resource.parse_detail_uri('/api/v1/notes/1/'), {'pk': '1'})
+        self.assertEqual(resource.parse_detail_uri('/api/v1/notes/'), None)
+        self.assertEqual(resource.parse_detail_uri('/api/v1/notes/1/comments/'), None)
+        self.assertEqual(resource.parse_detail_uri('/api/v1/users/1/'), None)
+        self.assertEqual(resource.parse_detail_uri('http://example.com/'), None)
+
+        # Resources that add their own URLs are left to ``resolve``.
+        class PrependedNoteResource(NoteResource):
+            def prepend_urls(self):
+                return []
+
+        resource = PrependedNoteResource(api_name='v1')
+        self.assertEqual(resource.get_detail_uri_pattern(), None)
+        self.assertEqual(resource.parse_detail_uri('/api/v1/notes/1/'), None)
+        self.assertEqual(resource.get_via_uri('/api/v1/notes/1/', request=HttpRequest()).pk, 1)
+
     def test_create_identifier(self):
         resource = NoteResource()
         new_note = Note.objects.get(pk=1)
@@ -2391,6 +2669,252 @@ class ModelResourceTestCase(TestCase):
         for note in resp['objects']:
             self.assertNotIn('content', note)
 
+    def test_cache_responses(self):
+        resource = CachedResponseNoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        resource.invalidate_response_cache()
+
+        resp = resource.get_list(request)
+        self.assertEqual(resp.status_code, 200)
+
+        with self.assertNumQueries(0):
+            cached = resource.get_list(request)
+            self.assertEqual(cached.content, resp.content)
+            self.assertEqual(resource.get_list(request).content, resp.content)
+
+        # Other parameters get their own entry.
+        request.GET = {'format': 'json', 'limit': 1}
+        self.assertNotEqual(resource.get_list(request).content, resp.content)
+
+        request.GET = {'format': 'json'}
+        detail = resource.get_detail(request, pk='1')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.get_detail(request, pk='1').content, detail.content)
+
+        # Writes orphan the cached responses.
+        note = Note.objects.get(pk=1)
+        bundle = resource.build_bundle(obj=note, data={'title': 'Cached no more'}, request=request)
+        resource.obj_update(bundle, pk='1')
+        self.assertTrue('Cached no more' in resource.get_detail(request, pk='1').content.decode('utf-8'))
+        self.assertTrue('Cached no more' in resource.get_list(request).content.decode('utf-8'))
+
+    def test_paginate_count_strategy(self):
+        # Only the ``cached`` strategy needs the count's cache key.
+        for resource_class, key_calls in ((CachedCountNoteResource, 1), (EstimatedCountNoteResource, 0)):
+            resource = resource_class()
+            base_bundle = resource.build_bundle(request=HttpRequest())
+
+            with patch.object(resource, 'generate_cache_key', wraps=resource.generate_cache_key) as generate_cache_key:
+                page = resource.paginate(base_bundle, resource.get_object_list(base_bundle.request))
+
+            self.assertEqual(page['meta']['total_count'], 4)
+            self.assertEqual(generate_cache_key.call_count, key_calls)
+
+    def test_cache_generations_per_request(self):
+        resource = CachedResponseNoteResource()
+        cache_obj = resource._meta.cache
+        request = HttpRequest()
+        request.GET = {'format': 'json'}
+        resource.get_list(request)
+
+        with patch.object(cache_obj, 'get_generations', wraps=cache_obj.get_generations) as get_generations:
+            resource.get_list(request)
+            resource.generate_cache_key('count', _request=request)
+            self.assertEqual(get_generations.call_count, 0)
+
+            # A bump drops what the request knew, so it fetches again.
+            before = resource.generate_cache_key('count', _request=request)
+            resource.invalidate_cache(request=request)
+            self.assertNotEqual(resource.generate_cache_key('count', _request=request), before)
+            self.assertEqual(get_generations.call_count, 1)
+
+        # Without a request, generations are fetched every time.
+        with patch.object(cache_obj, 'get_generations', wraps=cache_obj.get_generations) as get_generations:
+            resource.generate_cache_key('count')
+            resource.generate_cache_key('count')
+            self.assertEqual(get_generations.call_count, 2)
+
+    def test_conditional_get(self):
+        resource = ConditionalNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+        resp = resource.get_list(request)
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp['ETag'].startswith('W/'))
+        self.assertFalse(resp.has_header('Last-Modified'))
+
+        # A matching version answers before anything is dehydrated.
+        request.META['HTTP_IF_NONE_MATCH'] = resp['ETag']
+
+        with self.assertNumQueries(1):
+            not_modified = resource.get_list(request)
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+
+        del request.META['HTTP_IF_NONE_MATCH']
+        detail = resource.get_detail(request, pk='1')
+        self.assertTrue(detail.has_header('Last-Modified'))
+        request.META['HTTP_IF_NONE_MATCH'] = detail['ETag']
+        self.assertEqual(resource.get_detail(request, pk='1').status_code, 304)
+        del request.META['HTTP_IF_NONE_MATCH']
+        request.META['HTTP_IF_MODIFIED_SINCE'] = detail['Last-Modified']
+        self.assertEqual(resource.get_detail(request, pk='1').status_code, 304)
+        del request.META['HTTP_IF_MODIFIED_SINCE']
+        request.META['HTTP_IF_NONE_MATCH'] = detail['ETag']
+
+        # Saving moves the version on.
+        Note.objects.get(pk=1).save()
+        self.assertEqual(resource.get_detail(request, pk='1').status_code, 200)
+
+        # Without a version function, the ETag hashes the body.
+        resource = BodyConditionalNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+        resp = resource.wrap_view('dispatch_list')(request)
+        self.assertFalse(resp['ETag'].startswith('W/'))
+
+        request.META['HTTP_IF_NONE_MATCH'] = resp['ETag']
+        self.assertEqual(resource.wrap_view('dispatch_list')(request).status_code, 304)
+
+    def test_conditional_get_list_deletion(self):
+        resource = ConditionalNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+        newest = resource.get_detail(request, pk=str(Note.objects.filter(is_active=True).latest('updated').pk))
+
+        # Deleting an older object doesn't move the latest ``updated``, so a
+        # client relying on ``If-Modified-Since`` alone must still get the list.
+        Note.objects.filter(is_active=True).order_by('updated')[0].delete()
+        request.META['HTTP_IF_MODIFIED_SINCE'] = newest['Last-Modified']
+        self.assertEqual(resource.get_list(request).status_code, 200)
+
+    def test_conditional_get_time_zone(self):
+        # Naive values are in ``TIME_ZONE``, not UTC.
+        resource = ConditionalNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        updated = datetime.datetime(2010, 4, 1, 20, 5)
+
+        with self.settings(USE_TZ=False, TIME_ZONE='America/Chicago'):
+            resp = resource.set_validators(HttpResponse(), last_modified=updated)
+            self.assertEqual(resp['Last-Modified'], 'Fri, 02 Apr 2010 01:05:00 GMT')
+
+            request.META['HTTP_IF_MODIFIED_SINCE'] = resp['Last-Modified']
+            self.assertTrue(resource.is_not_modified(request, last_modified=updated))
+            self.assertFalse(resource.is_not_modified(request, last_modified=updated + datetime.timedelta(seconds=1)))
+            self.assertEqual(resource.get_response_validators(resp)[1], datetime.datetime(2010, 4, 2, 1, 5, tzinfo=utc))
+
+    def test_conditional_get_cached_responses(self):
+        resource = CachedConditionalNoteResource()
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'format': 'json'}
+        resource.invalidate_cache()
+        resp = resource.get_list(request)
+        detail = resource.get_detail(request, pk='1')
+
+        # Cache hits carry the same validators as the misses did.
+        with self.assertNumQueries(0):
+            cached = resource.get_list(request)
+            cached_detail = resource.get_detail(request, pk='1')
+
+        self.assertEqual(cached.content, resp.content)
+        self.assertEqual(cached['ETag'], resp['ETag'])
+        self.assertTrue(cached['ETag'].startswith('W/'))
+        self.assertEqual(cached_detail['ETag'], detail['ETag'])
+        self.assertEqual(cached_detail['Last-Modified'], detail['Last-Modified'])
+
+        # So a matching client still gets a 304, without a query.
+        request.META['HTTP_IF_NONE_MATCH'] = resp['ETag']
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.get_list(request).status_code, 304)
+
+        request.META['HTTP_IF_NONE_MATCH'] = detail['ETag']
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resource.get_detail(request, pk='1').status_code, 304)
+
+    def test_get_list_stream(self):
+        resource = StreamHintNoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json', 'limit': 2}
+        resp = resource.get_list(request)
+
+        request.GET = {'format': 'json', 'limit': 2, 'stream': '1'}
+        streamed = resource.get_list(request)
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content), resp.content)
+
+        # Streaming is JSON-only.
+        request.GET = {'format': 'xml', 'stream': '1'}
+        self.assertFalse(resource.get_list(request).streaming)
+
+        # The hint is ignored unless the resource allows it.
+        request.GET = {'format': 'json', 'limit': 2, 'stream': '1'}
+        self.assertFalse(NoteResource().get_list(request).streaming)
+
+    def test_get_list_stream_altered(self):
+        # ``alter_list_data_to_serialize`` can't be skipped by streaming.
+        resource = AlteredStreamHintNoteResource()
+        request = HttpRequest()
+        request.GET = {'format': 'json', 'limit': 2, 'stream': '1'}
+        resp = resource.get_list(request)
+        self.assertFalse(resp.streaming)
+        self.assertEqual(json.loads(resp.content.decode('utf-8'))['meta'], {'altered': True})
+
+    def test_prefetch_to_many(self):
+        resource = RelatedNoteResource()
+        base_bundle = resource.build_bundle(request=HttpRequest())
+        self.assertEqual(resource.get_to_many_prefetch_lookups(base_bundle, for_list=True), ['subjects'])
+        self.assertEqual(NoteResource().get_to_many_prefetch_lookups(base_bundle, for_list=True), [])
+
+        # One query for the page, one for all of the subjects.
+        with self.assertNumQueries(2):
+            objects = resource.prefetch_to_many(base_bundle, Note.objects.all(), for_list=True)
+
+        with self.assertNumQueries(0):
+            for note in objects:
+                bundle = resource.build_bundle(obj=note, request=base_bundle.request)
+                resource.subjects.dehydrate(bundle, for_list=True)
+
+        self.assertEqual(resource.prefetch_to_many(base_bundle, [], for_list=True), [])
+
+    def test_get_auto_optimizer_params(self):
+        resource = AutoOptimizeNoteResource()
+        base_bundle = resource.build_bundle(request=HttpRequest())
+        prefetch_related_set, select_related_set = resource.get_auto_optimizer_params(for_list=True)
+        self.assertEqual(sorted(select_related_set), ['author'])
+        self.assertEqual(sorted(prefetch_related_set), ['author__notes', 'author__notes__subjects', 'subjects'])
+        self.assertTrue(resource.get_auto_optimizer_params(for_list=True) is resource.get_auto_optimizer_params(for_list=True))
+
+        self.assertEqual(resource.get_query_optimizer_params(base_bundle, for_list=True), (set(prefetch_related_set), set(select_related_set)))
+        self.assertEqual(RelatedNoteResource().get_query_optimizer_params(base_bundle, for_list=True), (set(), set()))
+
+        # ``full_list``/``full_detail`` follow the mode, & a callable
+        # ``use_in`` is left out.
+        resource = AutoOptimizeDetailNoteResource()
+        self.assertEqual(resource.get_auto_optimizer_params(for_list=True), (frozenset(), frozenset(['author'])))
+        self.assertEqual(resource.get_auto_optimizer_params(for_list=False), (frozenset(['author__notes', 'author__notes__subjects']), frozenset(['author'])))
+
+    def test_get_projected_columns(self):
+        resource = ProjectedNoteResource()
+        self.assertEqual(resource.get_projected_columns(for_list=True), ('author', 'id', 'slug', 'title'))
+        self.assertEqual(ProjectedPropertyNoteResource().get_projected_columns(for_list=True), None)
+
+        base_bundle = resource.build_bundle(request=HttpRequest())
+        objects = resource.obj_get_list(base_bundle)
+        self.assertEqual(objects.query.deferred_loading, (frozenset(['author', 'id', 'slug', 'title']), False))
+        self.assertEqual([note.title for note in objects], [note.title for note in Note.objects.all()])
+
+        objects = ProjectedPropertyNoteResource().obj_get_list(base_bundle)
+        self.assertEqual(objects.query.deferred_loading, (frozenset(), True))
 
     def test_get_detail(self):
         resource = NoteResource()
@@ -2643,6 +3167,49 @@ class ModelResourceTestCase(TestCase):
         updated_note = Note.objects.get(pk=2)
         self.assertEqual(updated_note.content, "This is note 2.")
 
+    def test_obj_create_list(self):
+        resource = BulkCreateNoteResource()
+        request = HttpRequest()
+        data = [{'title': 'Bulk %s' % i, 'slug': 'bulk-%s' % i, 'author': '/api/v1/users/1/'} for i in range(3)]
+        bundles = [resource.build_bundle(data=dict(item), request=request) for item in data]
+        bulk_supported = getattr(connection.features, 'can_return_rows_from_bulk_insert', getattr(connection.features, 'can_return_ids_from_bulk_insert', False))
+        self.assertEqual(resource.can_bulk_create(bundles), bulk_supported)
+
+        # Related saves rule it out.
+        with_subjects = [resource.build_bundle(data=dict(item, subjects=['/api/v1/subjects/1/']), request=request) for item in data]
+        self.assertFalse(resource.can_bulk_create(with_subjects))
+        with_nested = [resource.build_bundle(data=dict(item, author={'username': 'bulk'}), request=request) for item in data]
+        self.assertFalse(resource.can_bulk_create(with_nested))
+        self.assertFalse(RelatedNoteResource().can_bulk_create(bundles))
+
+        created = resource.obj_create_list(bundles)
+        self.assertTrue(created is bundles)
+        self.assertEqual(Note.objects.filter(slug__startswith='bulk-', author=1).count(), 3)
+
+        if bulk_supported:
+            self.assertTrue(all(bundle.obj.pk for bundle in created))
+
+        # One at a time, the bundles passed in come back as well.
+        plain_resource = RelatedNoteResource()
+        plain = [plain_resource.build_bundle(data=dict(item, slug='plain-%s' % i), request=request) for i, item in enumerate(data)]
+        self.assertTrue(plain_resource.obj_create_list(plain) is plain)
+        self.assertEqual(Note.objects.filter(slug__startswith='plain-').count(), 3)
+
+    def test_obj_create_list_create_detail(self):
+        # Authorizations that don't accept a plain list of new objects in
+        # ``create_list`` are asked about each object instead.
+        resource = BulkCreateDetailNoteResource()
+        request = HttpRequest()
+        data = [{'title': 'Bulk %s' % i, 'slug': 'bulk-%s' % i, 'author': '/api/v1/users/1/'} for i in range(3)]
+        bundles = [resource.build_bundle(data=item, request=request) for item in data]
+        authorization = resource._meta.authorization
+
+        with patch.object(authorization, 'create_detail', wraps=authorization.create_detail) as create_detail:
+            resource.obj_create_list(bundles)
+
+        self.assertEqual(create_detail.call_count, 3)
+        self.assertEqual(Note.objects.filter(slug__startswith='bulk-').count(), 3)
+
     def test_patch_list_return_data(self):
         always_resource = AlwaysDataNoteResource()
         request = HttpRequest()
@@ -3224,6 +3791,32 @@ class ModelResourceTestCase(TestCase):
         self.assertEqual(resource.generate_cache_key(foo='bar', moof='baz'), 'None:notes::foo=bar:moof=baz')
         self.assertEqual(resource.generate_cache_key('abc', '123', foo='bar', moof='baz'), 'None:notes:abc:123:foo=bar:moof=baz')
 
+    def test_invalidate_cache(self):
+        resource = CachedResponseNoteResource()
+        resource.invalidate_cache()
+        detail_key = resource.generate_cache_key('detail', pk='1')
+        other_key = resource.generate_cache_key('detail', pk='2')
+        list_key = resource.generate_cache_key('list')
+        self.assertEqual(resource.generate_cache_key('detail', pk='1'), detail_key)
+
+        # One object's keys & the list keys go, other objects' stay.
+        resource.invalidate_cache(Note.objects.get(pk=1))
+        self.assertNotEqual(resource.generate_cache_key('detail', pk='1'), detail_key)
+        self.assertEqual(resource.generate_cache_key('detail', pk='2'), other_key)
+        self.assertNotEqual(resource.generate_cache_key('list'), list_key)
+
+        # Everything goes.
+        resource.invalidate_cache()
+        self.assertNotEqual(resource.generate_cache_key('detail', pk='2'), other_key)
+
+        # Writes invalidate the cached objects.
+        base_bundle = Bundle()
+        self.assertEqual(resource.cached_obj_get(base_bundle, pk='1').title, u'First Post!')
+        note = Note.objects.get(pk=1)
+        bundle = resource.build_bundle(obj=note, data={'title': 'Fresh'}, request=HttpRequest())
+        resource.obj_update(bundle, pk='1')
+        self.assertEqual(resource.cached_obj_get(base_bundle, pk='1').title, u'Fresh')
+
     def test_cached_fetch_list(self):
         resource = NoteResource()
         base_bundle = Bundle()
@@ -2,14 +2,16 @@
 from builtins import object
 import datetime
 import yaml
+import six
 from decimal import Decimal
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
+from mock import patch
 from tastypie.bundle import Bundle
 from tastypie import fields
 from tastypie.exceptions import BadRequest
-from tastypie.serializers import Serializer
+from tastypie.serializers import Serializer, JSONBackend, OrjsonBackend, UjsonBackend, JSON_BACKENDS
 from tastypie.resources import ModelResource
 from core.models import Note
 
@@ -18,6 +20,11 @@ try:
 except ImportError:
     biplist = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class UnsafeObject(object):
     pass
@@ -261,6 +268,91 @@ class SerializerTestCase(TestCase):
         sample_1 = self.get_sample1()
         self.assertEqual(serializer.to_json(sample_1), u'{"age": 27, "date_joined": "2010-03-27", "name": "Daniel", "snowman": "☃"}')
 
+    def test_to_json_stream(self):
+        serializer = Serializer()
+
+        sample_1 = self.get_sample1()
+        data = {'meta': {'total_count': 2}, 'objects': [sample_1, sample_1]}
+        stream = serializer.to_json_stream({'meta': data['meta']}, 'objects', iter(data['objects']))
+        self.assertEqual(u''.join(stream), serializer.to_json(data))
+        self.assertEqual(u''.join(serializer.to_json_stream({}, 'objects', [])), u'{"objects": []}')
+
+    def test_register_converter(self):
+        serializer = Serializer()
+        data = {'price': Decimal('1.50'), 'prices': (Decimal('2'),)}
+        self.assertEqual(serializer.to_simple(data, {}), {'price': '1.50', 'prices': ['2']})
+
+        serializer.register_converter(Decimal, lambda data, options: [float(data)])
+        self.assertEqual(serializer.to_simple(data, {}), {'price': [1.5], 'prices': [[2.0]]})
+
+        # Other serializers are left alone.
+        self.assertEqual(Serializer().to_simple(data, {}), {'price': '1.50', 'prices': ['2']})
+
+        # A converter returning its input's type ends the unwrapping.
+        serializer.register_converter(Decimal, lambda data, options: data.quantize(Decimal('0.1')))
+        self.assertEqual(serializer.to_simple(data, {}), {'price': Decimal('1.5'), 'prices': [Decimal('2.0')]})
+
+    def test_to_simple_integers(self):
+        serializer = Serializer()
+
+        for integer_type in six.integer_types:
+            simple = serializer.to_simple({'count': integer_type(2 ** 40)}, {})
+            self.assertEqual(simple, {'count': 2 ** 40})
+            self.assertTrue(type(simple['count']) is integer_type)
+
+    def test_to_json_fused(self):
+        serializer = Serializer()
+        self.assertTrue(serializer.can_fuse_json())
+
+        bundle = Bundle(data={'created': datetime.datetime(2010, 12, 16, 3, 2, 14), 'price': Decimal('1.50'), 'tags': ('a', 'b')})
+        data = {'meta': {'total_count': 1}, 'objects': [bundle]}
+        expected = serializer.json_backend.dumps(serializer.to_simple(data, {}))
+        self.assertEqual(serializer.to_json(data), expected)
+
+        # Converters for JSON-native types need the ``to_simple`` pass.
+        serializer.register_converter(str, lambda data, options: data)
+        self.assertFalse(serializer.can_fuse_json())
+        self.assertEqual(serializer.to_json(data), expected)
+        self.assertFalse(Serializer(json_backend=UjsonBackend()).can_fuse_json())
+
+    def test_to_json_fused_page(self):
+        # A full page, as timed when fusing: the output has to match the
+        # ``to_simple`` + ``dumps`` path exactly.
+        serializer = Serializer()
+        unfused = Serializer()
+        unfused._fused_json = False
+        objects = []
+
+        for i in range(1000):
+            objects.append(Bundle(data={
+                'id': i,
+                'title': u'note %s ☃' % i,
+                'created': datetime.datetime(2010, 1, 1, 3, 4, 5),
+                'price': Decimal('1.50'),
+                'tags': ['/api/v1/tags/%s/' % j for j in range(3)],
+                'author': Bundle(data={'name': 'Daniel', 'joined': datetime.date(2010, 3, 27)}),
+                'score': 1.5,
+                'is_active': True,
+                'deleted': None,
+            }))
+
+        page = {'meta': {'limit': 1000, 'total_count': 1000, 'next': None}, 'objects': objects}
+        self.assertEqual(serializer.to_json(page), unfused.to_json(page))
+
+    def test_json_backend(self):
+        self.assertTrue(isinstance(Serializer().json_backend, JSONBackend))
+        self.assertRaises(ImproperlyConfigured, Serializer, json_backend='nope')
+
+        if orjson is not None:
+            sample_1 = self.get_sample1()
+            serializer = Serializer(json_backend=OrjsonBackend())
+            self.assertEqual(serializer.to_json(sample_1), u'{"age":27,"date_joined":"2010-03-27","name":"Daniel","snowman":"☃"}')
+            self.assertEqual(serializer.from_json(serializer.to_json(sample_1)), Serializer().from_json(Serializer().to_json(sample_1)))
+
+        # Uninstalled backends fall back to the standard library.
+        with patch.dict(JSON_BACKENDS, {'ujson': (UjsonBackend, None)}):
+            self.assertEqual(type(Serializer(json_backend='ujson').json_backend), JSONBackend)
+
     def test_from_json(self):
         serializer = Serializer()
 
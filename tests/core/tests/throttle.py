@@ -1,11 +1,13 @@
 import time
 
+import mock
+
 from django.core.cache import cache
 from django.test import TestCase
 from django.utils.encoding import force_str
 
 from tastypie.models import ApiAccess
-from tastypie.throttle import BaseThrottle, CacheThrottle, CacheDBThrottle
+from tastypie.throttle import BaseThrottle, CacheThrottle, CacheDBThrottle, SlidingWindowThrottle, BufferedCacheDBThrottle, ApiAccessQueue
 
 
 class NoThrottleTestCase(TestCase):
@@ -78,6 +80,47 @@ class CacheThrottleTestCase(TestCase):
         self.assertEqual(len(cache.get('daniel_accesses')), 0)
 
 
+class SlidingWindowThrottleTestCase(TestCase):
+    def test_get_access_count(self):
+        throttle_1 = SlidingWindowThrottle(throttle_at=2, timeframe=10)
+        window, elapsed = throttle_1.get_window(105)
+        self.assertEqual(window, 10)
+        self.assertEqual(elapsed, 0.5)
+        self.assertEqual(throttle_1.get_window_key('Mr. Pants', 10), 'Mr.Pants_accesses_10')
+
+        cache.set('daniel_accesses_9', 4)
+        cache.set('daniel_accesses_10', 1)
+
+        try:
+            # Half of the previous window still overlaps.
+            self.assertEqual(throttle_1.get_access_count('daniel', now=105), 3)
+            self.assertEqual(throttle_1.get_access_count('daniel', now=110), 1)
+            self.assertEqual(throttle_1.get_access_count('cody', now=105), 0)
+        finally:
+            cache.delete('daniel_accesses_9')
+            cache.delete('daniel_accesses_10')
+
+    def test_throttling(self):
+        throttle_1 = SlidingWindowThrottle(throttle_at=2, timeframe=2)
+        # Start at the beginning of a window.
+        time.sleep(2 - time.time() % 2)
+
+        self.assertEqual(throttle_1.should_be_throttled('daniel'), False)
+        self.assertEqual(throttle_1.accessed('daniel'), None)
+        self.assertEqual(throttle_1.should_be_throttled('daniel'), False)
+        self.assertEqual(throttle_1.accessed('daniel'), None)
+
+        # THROTTLE'D!
+        self.assertEqual(throttle_1.should_be_throttled('daniel'), True)
+
+        # Should be no interplay.
+        self.assertEqual(throttle_1.should_be_throttled('cody'), False)
+
+        # Test the timeframe.
+        time.sleep(4)
+        self.assertEqual(throttle_1.should_be_throttled('daniel'), False)
+
+
 class CacheDBThrottleTestCase(TestCase):
     def tearDown(self):
         cache.delete('daniel_accesses')
@@ -134,6 +177,78 @@ class CacheDBThrottleTestCase(TestCase):
         self.assertEqual(ApiAccess.objects.filter(identifier='daniel').count(), 4)
 
 
+class BufferedCacheDBThrottleTestCase(TestCase):
+    def tearDown(self):
+        cache.delete('daniel_accesses')
+        cache.delete('cody_accesses')
+
+        for name in ('head', 'tail', 'lock', 'gap', 1, 2, 3, 4, 5):
+            cache.delete('tastypie_api_access_%s' % name)
+
+    def test_throttling(self):
+        throttle_1 = BufferedCacheDBThrottle(throttle_at=2, timeframe=5, expiration=2, flush_interval=None)
+
+        self.assertEqual(throttle_1.should_be_throttled('daniel'), False)
+        self.assertEqual(throttle_1.accessed('daniel', url='/api/v1/notes/', request_method='GET'), None)
+        self.assertEqual(throttle_1.accessed('cody'), None)
+
+        # Nothing is written during the request.
+        self.assertEqual(len(cache.get('daniel_accesses')), 1)
+        self.assertEqual(ApiAccess.objects.count(), 0)
+
+        throttle_1.flush()
+        self.assertEqual(ApiAccess.objects.count(), 2)
+        access = ApiAccess.objects.get(identifier='daniel')
+        self.assertEqual(access.url, '/api/v1/notes/')
+        self.assertEqual(access.request_method, 'GET')
+
+        # Already drained.
+        throttle_1.flush()
+        self.assertEqual(ApiAccess.objects.count(), 2)
+
+    def test_drain(self):
+        queue = ApiAccessQueue()
+
+        for identifier in ('daniel', 'cody', 'daniel', 'daniel', 'cody'):
+            queue.push(identifier)
+
+        # Evicted.
+        cache.delete('tastypie_api_access_2')
+        # Pushed, but not landed yet.
+        cache.delete('tastypie_api_access_5')
+
+        # Nothing past a missing record is written within the grace period.
+        self.assertEqual(len(queue.drain(batch_size=2)), 1)
+        self.assertEqual(cache.get('tastypie_api_access_head'), 1)
+        self.assertEqual(len(queue.drain(batch_size=2)), 0)
+
+        # Once it's over, the missing records count as evicted.
+        with mock.patch('tastypie.throttle.time.time', return_value=time.time() + queue.grace_period):
+            self.assertEqual(len(queue.drain(batch_size=2)), 2)
+
+        self.assertEqual(ApiAccess.objects.count(), 3)
+        self.assertEqual(cache.get('tastypie_api_access_head'), 5)
+
+    def test_drain_out_of_order(self):
+        queue = ApiAccessQueue()
+
+        for identifier in ('daniel', 'cody', 'daniel'):
+            queue.push(identifier)
+
+        # The second ``push`` has its position, but its ``set`` lands after
+        # the third one's.
+        record = cache.get('tastypie_api_access_2')
+        cache.delete('tastypie_api_access_2')
+        self.assertEqual(len(queue.drain(batch_size=10)), 1)
+        self.assertEqual(cache.get('tastypie_api_access_head'), 1)
+
+        cache.set('tastypie_api_access_2', record)
+        self.assertEqual(len(queue.drain(batch_size=10)), 2)
+        self.assertEqual(ApiAccess.objects.filter(identifier='cody').count(), 1)
+        self.assertEqual(ApiAccess.objects.count(), 3)
+        self.assertEqual(cache.get('tastypie_api_access_head'), 3)
+
+
 class ModelTestCase(TestCase):
     def test_unicode(self):
         access = ApiAccess(identifier="testing", accessed=0)
@@ -6,8 +6,9 @@ from django.test import TestCase
 
 from tastypie.exceptions import BadRequest
 from tastypie.serializers import Serializer
-from tastypie.utils.mime import determine_format, build_content_type
+from tastypie.utils.mime import determine_format, build_content_type, best_match, best_matches
 from tastypie.utils.timezone import now
+from tastypie.utils.urls import UriTrie
 
 try:
     from django.utils import timezone as dj_tz
@@ -101,6 +102,43 @@ class MimeTestCase(TestCase):
         self.assertRaises(BadRequest, determine_format, request, serializer)
 
 
+    def test_best_match(self):
+        best_matches.clear()
+        formats = ['application/xml', 'application/json']
+        self.assertEqual(best_match(formats, 'application/json'), 'application/json')
+        self.assertEqual(best_match(formats, 'text/html'), '')
+        self.assertEqual(list(best_matches.keys()), [(tuple(formats), 'application/json'), (tuple(formats), 'text/html')])
+
+        # Hits move to the fresh end, the stalest entries are dropped.
+        self.assertEqual(best_match(formats, 'application/json'), 'application/json')
+        self.assertEqual(list(best_matches.keys()), [(tuple(formats), 'text/html'), (tuple(formats), 'application/json')])
+
+        for index in range(best_matches.size_limit):
+            best_match(formats, 'application/x-%s' % index)
+
+        self.assertEqual(len(best_matches), best_matches.size_limit)
+        self.assertFalse((tuple(formats), 'application/json') in best_matches)
+
+        # Malformed headers aren't cached.
+        self.assertRaises(ValueError, best_match, formats, 'bogon')
+        self.assertFalse((tuple(formats), 'bogon') in best_matches)
+
+
+class UriTrieTestCase(TestCase):
+    def test_lookup(self):
+        trie = UriTrie()
+        self.assertEqual(trie.lookup('/api/v1/notes/1/'), None)
+
+        trie.add('/api/v1/notes/', 'notes')
+        trie.add('/api/v1/notes/1/comments/', 'comments')
+        self.assertEqual(trie.lookup('/api/v1/notes/'), 'notes')
+        self.assertEqual(trie.lookup('/api/v1/notes/1/'), 'notes')
+        self.assertEqual(trie.lookup('/api/v1/notes/1/comments/2/'), 'comments')
+        self.assertEqual(trie.lookup('/api/v1/notes/2/comments/2/'), 'notes')
+        self.assertEqual(trie.lookup('/api/v1/'), None)
+        self.assertEqual(trie.lookup('/api/v1/users/1/'), None)
+
+
 if TZ_AVAILABLE:
     from pytz.reference import Pacific
 